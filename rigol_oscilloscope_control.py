@@ -39,7 +39,14 @@ class RigolDS1104Z:
             
             self.scope = self.rm.open_resource(visa_address)
             self.scope.timeout = 5000  # 5 second timeout
-            
+            # Explicit terminators let PyVISA stop reading at the
+            # newline instead of scanning for it byte by byte (or
+            # waiting out the timeout), and a large chunk keeps bulk
+            # waveform reads in few transfers
+            self.scope.read_termination = '\n'
+            self.scope.write_termination = '\n'
+            self.scope.chunk_size = 102400
+
             # Query IDN to verify connection
             idn = self.scope.query('*IDN?')
             print(f"Connected successfully!")
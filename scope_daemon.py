@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Persistent oscilloscope connection daemon
+Holds one PyVISA connection open and serves SCPI requests over a Unix
+socket, so quick CLI tools (zoom.py) skip the TCP handshake and *IDN?
+probe that otherwise cost 100-500 ms on every invocation.
+
+Usage: python3 scope_daemon.py
+Protocol: one JSON object per line, e.g.
+    {"cmd": "query", "arg": ":CHANnel1:SCALe?"}
+    {"cmd": "write", "arg": ":CHANnel1:SCALe 0.5"}
+Replies: {"ok": true, "result": ...} or {"ok": false, "error": "..."}
+"""
+
+import json
+import os
+import socket
+
+from rigol_oscilloscope_control import RigolDS1104Z
+import config
+
+SOCKET_PATH = '/tmp/anthroscope.sock'
+
+
+def _handle(ctrl, request):
+    """Execute one client request against the held connection"""
+    try:
+        cmd = request.get('cmd')
+        if cmd == 'query':
+            return {'ok': True,
+                    'result': ctrl.scope.query(request['arg']).strip()}
+        if cmd == 'write':
+            ctrl.scope.write(request['arg'])
+            return {'ok': True}
+        return {'ok': False, 'error': f'unknown command: {cmd!r}'}
+    except Exception as e:
+        return {'ok': False, 'error': str(e)}
+
+
+def serve(socket_path=SOCKET_PATH):
+    """Open the scope once and serve clients until interrupted"""
+    ctrl = RigolDS1104Z(config.RIGOL_IP)
+    if not ctrl.connect():
+        return 1
+
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(socket_path)
+    server.listen(1)
+    print(f"Scope daemon listening on {socket_path}")
+    print("Press Ctrl+C to stop")
+
+    try:
+        while True:
+            conn, _ = server.accept()
+            with conn, conn.makefile('rwb') as stream:
+                for line in stream:
+                    try:
+                        request = json.loads(line)
+                    except ValueError:
+                        break
+                    stream.write(json.dumps(_handle(ctrl, request))
+                                 .encode() + b'\n')
+                    stream.flush()
+    except KeyboardInterrupt:
+        print("\nShutting down")
+    finally:
+        server.close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        ctrl.scope.close()
+    return 0
+
+
+if __name__ == '__main__':
+    import sys
+    sys.exit(serve())
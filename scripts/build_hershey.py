@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Hershey Font Data Generator
+Regenerates text_rendering/_hershey_data.py from the procedural glyph
+definitions so the default font loads from a packed literal at import
+instead of re-packing ~200 strokes.
+
+Run from the repository root after editing glyph definitions:
+    python3 scripts/build_hershey.py
+"""
+
+import base64
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from text_rendering.hershey_font import HersheyFont
+
+
+HEADER = '''"""
+Precomputed Hershey font stroke data
+Generated by scripts/build_hershey.py - do not edit by hand
+"""
+
+import base64
+
+# (N, 4) float32 stroke segments, base85-encoded
+DATA = base64.b85decode(
+{data}
+)
+
+# char -> (offset, count, width) into the stroke table
+INDEX = {index}
+'''
+
+
+def main():
+    font = HersheyFont()
+
+    payload = base64.b85encode(font.strokes_xy.tobytes()).decode('ascii')
+    # Wrap the literal at 72 columns to keep the module readable
+    lines = [payload[i:i + 72] for i in range(0, len(payload), 72)]
+    data_literal = '\n'.join(f"    {line!r}" for line in lines)
+
+    index_items = ',\n'.join(
+        f"    {char!r}: ({offset}, {count}, {width!r})"
+        for char, (offset, count, width) in sorted(font.char_index.items()))
+    index_literal = '{\n' + index_items + '\n}'
+
+    out_path = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                            '..', 'text_rendering', '_hershey_data.py')
+    with open(out_path, 'w') as f:
+        f.write(HEADER.format(data=data_literal, index=index_literal))
+
+    print(f"✅ Wrote {os.path.normpath(out_path)} "
+          f"({len(font.strokes_xy)} strokes, {len(font.char_index)} entries)")
+
+
+if __name__ == '__main__':
+    main()
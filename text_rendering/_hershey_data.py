@@ -0,0 +1,154 @@
+"""
+Precomputed Hershey font stroke data
+Generated by scripts/build_hershey.py - do not edit by hand
+"""
+
+import base64
+
+# (N, 4) float32 stroke segments, base85-encoded
+DATA = base64.b85decode(
+    '00000000od00000000m{0002M000od0000$000od0002M000m{0000$000m{00000000m{00'
+    '000000od00000000od006*1000od004l%000m{004kM000m{00000000m{00000000od006*'
+    '100000hhninQ1cQ%hhninQ1cQ%w!?=&w!?=&w!?=&w!?=&Q1cQ%hhninQ1cQ%hhnin%E{9u0'
+    '06*1%E{9u006*1Q1cSNhhninQ1cSNhhninw!??Ow!?=&w!??Ow!?=&hhnk7Q1cQ%hhnk7Q1c'
+    'Q%006+i%E?nE006+i%E?nEhhnk7Q1cSNhhnk7Q1cSNw!??Ow!??Ow!??Ow!??OQ1cSNhhnk7'
+    'Q1cSNhhnk7Sl6DW006+iSl6DW006+iQ1cQ%hhnk7Q1cQ%hhnk7w!?=&w!??Ow!?=&w!??Ohh'
+    'ninQ1cSNhhninQ1cSN006*1%E{BF002P1000od002P1000m{002Nh000od002Nh000m{002P'
+    '100000002Nh0000000000000od00000000m{00000000od006*1000od0000000000005vs0'
+    '000000000000m{006*1000m{00000000m{004l%000od00000000m{004kM000od0002M002'
+    'P10000$002P100000000od00000000m{00000000od005vs000od005vs000od006*1007{?'
+    '006*1007{?006*10002M006*10002M005vs00000005vs000000000000000005vs0000000'
+    '6*10000$006*10000$006*1007`X006*1007`X005vs000m{005vs000m{00000000m{002N'
+    'h;YOxF%E{9u006*1%E{9u006*1002P1;YOxF002P1;YOxF;YOyw002Nh;YOyw002Nh006+i%'
+    'E?nE006+i%E?nE;YOyw002P1;YOyw002P1002P1;YOyw002P1;YOywSl6DW006+iSl6DW006'
+    '+i002Nh;YOyw002Nh;YOyw;YOxF002P100000000od00000000m{00000000od004kM000od'
+    '004kM000od006*1006+i006*1006+i006*1006*1006*1006*1004kM000m{004kM000m{00'
+    '000000m{00000000od00000000m{00000000od006*1000od0000000000005vs00000002N'
+    'h;YOxF%E{9u006*1%E{9u006*1002P1;YOxF002P1;YOxF;YOyw002Nh;YOyw002Nh006+i%'
+    'E?nE006+i%E?nE;YOyw002P1;YOyw002P1002P1;YOyw002P1;YOywSl6DW006+iSl6DW006'
+    '+i002Nh;YOyw002Nh;YOyw;YOxF002P1006*100000002Nh00000002Nh000m{002Nh006+i'
+    '002Nh006+i0000$0002N0000$0002N00000000od00000000od0002M0002N00000000od00'
+    '000000m{006*1000od00000000000000000000006*1000m{005xC000m{005xC000od005x'
+    'C000m{00000004l%00000004l%005vs000m{005vs000m{005vs000od002P1000m{002P10'
+    '00od002P1000m{002Nh000od002Nh000od002Nh000m{00000000m{00000000od00000000'
+    'm{005vs000m{005vs000m{006*1007`X006*1007`X006*10000$006*10000$005vs00000'
+    '005vs000000000000000006*100000hhninQ1cQ%hhninQ1cQ%w!?=&w!?=&w!?=&w!?=&Q1'
+    'cQ%hhninQ1cQ%hhnin%E{9u006*1%E{9u006*1Q1cSNhhninQ1cSNhhninw!??Ow!?=&w!??'
+    'Ow!?=&hhnk7Q1cQ%hhnk7Q1cQ%006+i%E?nE006+i%E?nEhhnk7Q1cSNhhnk7Q1cSNw!??Ow'
+    '!??Ow!??Ow!??OQ1cSNhhnk7Q1cSNhhnk7Sl6DW006+iSl6DW006+iQ1cQ%hhnk7Q1cQ%hhn'
+    'k7w!?=&w!??Ow!?=&w!??OhhninQ1cSNhhninQ1cSN006*1%E{BF002Nh002P1007`X000od'
+    '00000000m{00000000od00000000m{005vs000m{005vs000m{006*1007`X006*1007`X00'
+    '6*10000$006*10000$005vs00000005vs0000000000000000000000000006*1000od006+'
+    'i007{?005xC000od005xC000od0002M000od0002M000od00000007{?00000007{?000000'
+    '02P100000002P1006+i002Nh006+i002Nh006+i007`X006+i007`X004l%000m{004l%000'
+    'm{004l$000m{004l$000m{00000007`X002P1000m{002P1006+i002P1006+i0002M0002N'
+    '0002M0002N00000000od00000000od0000$0002N0000$0002N002Nh006+i002Nh006+i00'
+    '2Nh000m{004l%000m{00000000od00000000od004kM000m{005xC000m{0002M000od0002'
+    'M000od00000004kM00000004kM0000$000od0000$000od005vs000m{004l%000m{004kM0'
+    '00od004kM000m{004l%000od004l%000m{0000000000004kM000m{000000000000000000'
+    '0000000000od002P1000m{002Nh000m{002Nh000m{002P1000od002P1000od002Nh000od'
+    '005vs000008`6_NGjS_G8`6_NGjS_GFh*iPRb-w(Fh*iPRb-w(+v@Z`^YYF>+v@Z`^YYF>et'
+    'obd007`Xetobd007`X+v@bc^YYF>+v@bc^YYF>Fh*j)Rb-w(Fh*j)Rb-w(8`6`&GjS_G8`6`'
+    '&GjS_G005xC7Z!IW005xC7Z!IW8`6`&GjS`x8`6`&GjS`xFh*j)Rb-yPFh*j)Rb-yP+v@bc^'
+    'YYHX+v@bc^YYHX9$ti|007{?9$ti|007{?+v@Z`^YYHX+v@Z`^YYHXFh*iPRb-yPFh*iPRb-'
+    'yP8`6_NGjS`x8`6_NGjS`x005vs7Z&%X0002M006*100000000m{00000000m{00000000od'
+    '002P1007`X0002M000m{0002M000m{0000$000m{0000$000m{002Nh007`X002Nh007`X00'
+    '2Nh002Nh002Nh002Nh002P1000od002P1000od002Nh000od002P1000od002Nh000od002N'
+    'h000od004kM007{?004kM007{?004kM0002M004kM0002M0000$000000000$00000004kM0'
+    '000$004kM0000$004kM007`X004kM007`X002Nh000m{002Nh000m{002P1000m{002Nh000'
+    'm{002P1004l%002P1004l%005vs004l%002Nh0000$002Nh000od004kM000m{002P1000m{'
+    '002P1000m{002P100000002P100000002Nh00000002Nh00000004kM0002M004kM0002M00'
+    '4kM007{?004kM007{?002Nh000od002Nh000od002P1000od002Nh007`X0000$000m{0000'
+    '$000m{004l$000m{004l$000m{002P1007`X002P1007`X002P1006+i002P1006+i0002M0'
+    '002N0002M0002N00000000od00000000od0000$0002N0000$0002N002Nh006+i002Nh006'
+    '+i002Nh0002M002Nh0002M0000$000000000$000000002M000000002M00000002P10002M'
+    '002P1000m{004kM000m{004kM000m{004l$000od001CB004kMFh=4(jFGrNFh=4(jFGrNet'
+    'j?{007WHetj?{007WHFh=6PjFGrNFh=6PjFGrN001Ds004kM001Ds004kMFh=6P=-duKFh=6'
+    'P=-duK9$o~d006*09$o~d006*0Fh=4(=-duKFh=4(=-duK001CB004kM002Nh004l%w!;TNl'
+    'X&pIw!;TNlX&pI%E?nD004l$%E?nD004l$w!;U&lX&pIw!;U&lX&pI002P1004l%002P1004'
+    'l%w!;U&+u_5&w!;U&+u_5&Sl1q=007{?Sl1q=007{?w!;TN+u_5&w!;TN+u_5&002Nh004l%'
+    '002P1007{?0002M000od0002M000od004kL000od004kL000od002Nh007{?002Nh007{?00'
+    '2Nh006*1002Nh006*10000$0000%0000$0000%00000000m{00000000m{0002M0000%0002'
+    'M0000%002P1006*1002P1006*1002P10000$002P10000$0002M000000002M000000000$0'
+    '00000000$00000002Nh0000$0000#0002N004kK!zA*+004kK!zA*+004l#!zA*+004l#!zA'
+    '*+0002L0002N0002L0002N004l#pX~<0004l#pX~<0004kKpX~<0004kKpX~<00000#0002N'
+    '000000000%00000000m{00000000m{004l$001yS00000000m{00000004l%0000#0002N00'
+    '4kK!zA*+004kK!zA*+004l#!zA*+004l#!zA*+0002L0002N0002L0002N004l#pX~<0004l'
+    '#pX~<0004kKpX~<0004kKpX~<00000#0002N0002M007`X004l$000m{004l$000m{004kL0'
+    '00m{004kL000m{0000$007`X0000$007`X0000$002Nh0000$002Nh000000000000000000'
+    '0000000002P10000#0002N004kK!zA*+004kK!zA*+004l#!zA*+004l#!zA*+0002L0002N'
+    '0002L0002N004l#pX~<0004l#pX~<0004kKpX~<0004kKpX~<00000#0002N002P10000000'
+    '2Nh00000'
+)
+
+# char -> (offset, count, width) into the stroke table
+INDEX = {
+    ' ': (256, 0, 5),
+    '!': (236, 7, 2),
+    ',': (234, 2, 2),
+    '-': (255, 1, 7),
+    '.': (228, 6, 2),
+    '0': (144, 16, 11),
+    '1': (160, 2, 4),
+    '2': (162, 6, 7),
+    '3': (168, 8, 7),
+    '4': (176, 3, 8),
+    '5': (179, 7, 7),
+    '6': (186, 12, 7),
+    '7': (198, 2, 7),
+    '8': (200, 16, 7),
+    '9': (216, 12, 7),
+    '?': (243, 12, 5),
+    'A': (30, 3, 9),
+    'B': (33, 10, 7),
+    'C': (43, 9, 12),
+    'D': (52, 6, 7),
+    'E': (26, 4, 7),
+    'F': (58, 3, 7),
+    'G': (61, 10, 12),
+    'H': (23, 3, 7),
+    'I': (0, 3, 4),
+    'J': (71, 4, 6),
+    'K': (75, 3, 7),
+    'L': (3, 2, 7),
+    'M': (78, 4, 11),
+    'N': (82, 3, 7),
+    'O': (7, 16, 13),
+    'P': (85, 6, 7),
+    'Q': (91, 17, 13),
+    'R': (108, 7, 7),
+    'S': (115, 9, 7),
+    'T': (5, 2, 8),
+    'U': (124, 6, 7),
+    'V': (130, 2, 9),
+    'W': (132, 4, 11),
+    'X': (136, 2, 9),
+    'Y': (138, 3, 9),
+    'Z': (141, 3, 7),
+    'a': (30, 3, 9),
+    'b': (33, 10, 7),
+    'c': (43, 9, 12),
+    'd': (52, 6, 7),
+    'e': (26, 4, 7),
+    'f': (58, 3, 7),
+    'g': (61, 10, 12),
+    'h': (23, 3, 7),
+    'i': (0, 3, 4),
+    'j': (71, 4, 6),
+    'k': (75, 3, 7),
+    'l': (3, 2, 7),
+    'm': (78, 4, 11),
+    'n': (82, 3, 7),
+    'o': (7, 16, 13),
+    'p': (85, 6, 7),
+    'q': (91, 17, 13),
+    'r': (108, 7, 7),
+    's': (115, 9, 7),
+    't': (5, 2, 8),
+    'u': (124, 6, 7),
+    'v': (130, 2, 9),
+    'w': (132, 4, 11),
+    'x': (136, 2, 9),
+    'y': (138, 3, 9),
+    'z': (141, 3, 7)
+}
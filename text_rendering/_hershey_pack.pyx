@@ -0,0 +1,42 @@
+# cython: boundscheck=False, wraparound=False, cdivision=True
+"""
+Optional compiled fast path for HersheyFont.render_text batch assembly
+
+The project has no build step, so this module is never compiled
+automatically; on constrained targets (e.g. a Pi Zero driving a retro
+scope) it can be built by hand with
+
+    cythonize -i text_rendering/_hershey_pack.pyx
+
+and hershey_font.py will pick it up via a guarded import. When the
+compiled module is absent the pure-NumPy path is used instead.
+"""
+
+
+cpdef int assemble_segments(const short[:, :] strokes_i16,
+                            const int[:] offsets,
+                            const int[:] counts,
+                            const float[:] starts,
+                            float inv,
+                            float scale,
+                            float[:, :] out) nogil:
+    """
+    Copy per-glyph stroke spans into one output buffer
+
+    Dequantizes the int16 stroke table by ``inv`` and shifts the X
+    columns of each span by its glyph start position, writing rows of
+    (x1, y1, x2, y2) into ``out``. Returns the number of rows written.
+    """
+    cdef Py_ssize_t span, i, src
+    cdef Py_ssize_t row = 0
+    cdef float shift
+    for span in range(offsets.shape[0]):
+        shift = starts[span] * scale
+        src = offsets[span]
+        for i in range(counts[span]):
+            out[row, 0] = strokes_i16[src + i, 0] * inv + shift
+            out[row, 1] = strokes_i16[src + i, 1] * inv
+            out[row, 2] = strokes_i16[src + i, 2] * inv + shift
+            out[row, 3] = strokes_i16[src + i, 3] * inv
+            row += 1
+    return <int>row
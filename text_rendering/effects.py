@@ -14,6 +14,21 @@ from typing import Tuple, List
 class TextEffects:
     """Advanced visual effects for oscilloscope text rendering"""
 
+    # Active array namespace. Defaults to numpy; set_backend(cupy) moves
+    # every effect onto the GPU with no other code changes since all
+    # array ops used here are drop-in compatible.
+    xp = np
+
+    @classmethod
+    def set_backend(cls, xp) -> None:
+        """
+        Select the array backend used by all effects
+
+        Args:
+            xp: Array namespace (e.g. numpy or cupy)
+        """
+        cls.xp = xp
+
     @staticmethod
     def rotate(x: np.ndarray, y: np.ndarray, angle_degrees: float) -> Tuple[np.ndarray, np.ndarray]:
         """
@@ -27,9 +42,21 @@ class TextEffects:
         Returns:
             Tuple of (rotated_x, rotated_y)
         """
+        # Fast paths for exact quarter turns: just swaps and sign flips,
+        # no trig and no multiplies
+        a = angle_degrees % 360
+        if abs(a) < 1e-9 or abs(a - 360) < 1e-9:
+            return x, y
+        elif abs(a - 90) < 1e-9:
+            return -y, x
+        elif abs(a - 180) < 1e-9:
+            return -x, -y
+        elif abs(a - 270) < 1e-9:
+            return y, -x
+
         angle_rad = np.radians(angle_degrees)
-        cos_a = np.cos(angle_rad)
-        sin_a = np.sin(angle_rad)
+        cos_a = float(np.cos(angle_rad))
+        sin_a = float(np.sin(angle_rad))
 
         # Rotation matrix
         x_rot = x * cos_a - y * sin_a
@@ -74,6 +101,32 @@ class TextEffects:
 
         return x_skewed, y_skewed
 
+    @staticmethod
+    def wave_effect_axis(x: np.ndarray, y: np.ndarray,
+                        amplitude: float, frequency: float,
+                        axis: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Apply sine wave distortion along a coordinate axis
+
+        Args:
+            x: X coordinates
+            y: Y coordinates
+            amplitude: Wave amplitude
+            frequency: Wave frequency
+            axis: 0 = sine of X displaces Y, 1 = sine of Y displaces X
+
+        Returns:
+            Tuple of (waved_x, waved_y)
+        """
+        # Single vectorized path regardless of axis; waves can be
+        # composed by calling again on the returned rows
+        xp = TextEffects.xp
+        xy = xp.stack([x, y]).astype(float, copy=False)
+        disp = xp.sin(frequency * xy[axis])
+        disp *= amplitude
+        xy[1 - axis] += disp
+        return xy[0], xy[1]
+
     @staticmethod
     def wave_effect(x: np.ndarray, y: np.ndarray,
                    amplitude: float, frequency: float,
@@ -91,14 +144,9 @@ class TextEffects:
         Returns:
             Tuple of (waved_x, waved_y)
         """
-        if direction == 'x':
-            # Wave in X direction (vertical displacement)
-            y_waved = y + amplitude * np.sin(frequency * x)
-            return x, y_waved
-        else:
-            # Wave in Y direction (horizontal displacement)
-            x_waved = x + amplitude * np.sin(frequency * y)
-            return x_waved, y
+        # Thin string-accepting wrapper around the axis-indexed version
+        axis = 0 if direction == 'x' else 1
+        return TextEffects.wave_effect_axis(x, y, amplitude, frequency, axis)
 
     @staticmethod
     def perspective_3d(x: np.ndarray, y: np.ndarray,
@@ -136,6 +184,68 @@ class TextEffects:
 
         return x_persp, y_persp
 
+    # Last resample computed by morph(): (key, x1_interp, y1_interp).
+    # Animations morph the same two paths across many frames, so a
+    # single-entry cache removes the per-frame interpolation entirely.
+    _morph_cache = None
+
+    @staticmethod
+    def _resample_to(x1: np.ndarray, y1: np.ndarray,
+                    n2: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Resample a path to n2 points"""
+        xp = TextEffects.xp
+        n1 = len(x1)
+
+        # For densely sampled paths of comparable length, FFT resampling
+        # handles x and y in one pass as a complex signal and gives a
+        # smoother result than piecewise-linear interp
+        if xp is np and abs(n1 - n2) / n2 < 1.0:
+            from scipy import signal
+            z = signal.resample(x1 + 1j * y1, n2)
+            return z.real, z.imag
+
+        # Fallback: independent linear interpolation
+        t1 = xp.linspace(0, 1, n1)
+        t2 = xp.linspace(0, 1, n2)
+        return xp.interp(t2, t1, x1), xp.interp(t2, t1, y1)
+
+    @staticmethod
+    def morph_prepare(x1: np.ndarray, y1: np.ndarray,
+                     x2: np.ndarray, y2: np.ndarray) -> tuple:
+        """
+        Precompute a morph handle for repeated morph_apply calls
+
+        Resamples the first path once so an animation loop only pays for
+        the two lerps per frame.
+
+        Args:
+            x1, y1: First text coordinates
+            x2, y2: Second text coordinates
+
+        Returns:
+            Opaque handle for morph_apply
+        """
+        if len(x1) != len(x2):
+            x1, y1 = TextEffects._resample_to(x1, y1, len(x2))
+        return (x1, y1, x2, y2)
+
+    @staticmethod
+    def morph_apply(handle: tuple, progress: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Evaluate a prepared morph at the given progress
+
+        Args:
+            handle: Handle from morph_prepare
+            progress: Morph progress (0.0 = first text, 1.0 = second text)
+
+        Returns:
+            Tuple of (morphed_x, morphed_y)
+        """
+        x1, y1, x2, y2 = handle
+        x_morph = x1 * (1 - progress) + x2 * progress
+        y_morph = y1 * (1 - progress) + y2 * progress
+        return x_morph, y_morph
+
     @staticmethod
     def morph(x1: np.ndarray, y1: np.ndarray,
              x2: np.ndarray, y2: np.ndarray,
@@ -153,14 +263,15 @@ class TextEffects:
         """
         # Ensure arrays are same length (interpolate if needed)
         if len(x1) != len(x2):
-            # Resample to match lengths
-            t1 = np.linspace(0, 1, len(x1))
-            t2 = np.linspace(0, 1, len(x2))
-
-            x1_interp = np.interp(t2, t1, x1)
-            y1_interp = np.interp(t2, t1, y1)
-
-            x1, y1 = x1_interp, y1_interp
+            # Reuse the resample from the previous frame when morphing
+            # the same pair of paths repeatedly
+            key = (x1.ctypes.data, y1.ctypes.data, len(x1), len(x2))
+            cached = TextEffects._morph_cache
+            if cached is not None and cached[0] == key:
+                x1, y1 = cached[1], cached[2]
+            else:
+                x1, y1 = TextEffects._resample_to(x1, y1, len(x2))
+                TextEffects._morph_cache = (key, x1, y1)
 
         # Linear interpolation
         x_morph = x1 * (1 - progress) + x2 * progress
@@ -170,7 +281,8 @@ class TextEffects:
 
     @staticmethod
     def outline_effect(x: np.ndarray, y: np.ndarray,
-                      thickness: float = 0.1) -> Tuple[np.ndarray, np.ndarray]:
+                      thickness: float = 0.1,
+                      stacked: bool = False) -> Tuple[np.ndarray, np.ndarray]:
         """
         Create outline/stroke effect by duplicating path with offset
 
@@ -178,35 +290,42 @@ class TextEffects:
             x: X coordinates
             y: Y coordinates
             thickness: Outline thickness
+            stacked: Return (5, N) arrays (one row per copy) instead of
+                     flat concatenated arrays — avoids the copy when the
+                     caller can render rows in order
 
         Returns:
             Tuple of (outlined_x, outlined_y)
         """
-        # Create 4 offset copies and combine
+        # Main path plus 4 offset copies (rows of a (5, N) buffer)
         offsets = [
+            (0, 0),
             (thickness, 0),
             (-thickness, 0),
             (0, thickness),
             (0, -thickness)
         ]
 
-        x_outlined = [x]
-        y_outlined = [y]
+        xp = TextEffects.xp
+        n = len(x)
+        x_outlined = xp.empty((len(offsets), n))
+        y_outlined = xp.empty((len(offsets), n))
 
-        for dx, dy in offsets:
-            x_outlined.append(x + dx)
-            y_outlined.append(y + dy)
+        for i, (dx, dy) in enumerate(offsets):
+            xp.add(x, dx, out=x_outlined[i])
+            xp.add(y, dy, out=y_outlined[i])
 
-        # Concatenate all paths
-        x_result = np.concatenate(x_outlined)
-        y_result = np.concatenate(y_outlined)
+        if stacked:
+            return x_outlined, y_outlined
 
-        return x_result, y_result
+        # Flatten into the concatenated form (rows are already contiguous)
+        return x_outlined.ravel(), y_outlined.ravel()
 
     @staticmethod
     def shadow_effect(x: np.ndarray, y: np.ndarray,
                      offset_x: float = 0.2,
-                     offset_y: float = -0.2) -> Tuple[np.ndarray, np.ndarray]:
+                     offset_y: float = -0.2,
+                     stacked: bool = False) -> Tuple[np.ndarray, np.ndarray]:
         """
         Add shadow by duplicating path with offset
 
@@ -215,19 +334,27 @@ class TextEffects:
             y: Y coordinates
             offset_x: Shadow X offset
             offset_y: Shadow Y offset
+            stacked: Return (2, N) arrays (shadow row, then main row)
+                     instead of flat concatenated arrays
 
         Returns:
             Tuple of (shadowed_x, shadowed_y) with shadow first, then main
         """
-        # Shadow copy (rendered first)
-        x_shadow = x + offset_x
-        y_shadow = y + offset_y
+        # Write shadow + original directly into one (2, N) buffer
+        xp = TextEffects.xp
+        n = len(x)
+        x_result = xp.empty((2, n))
+        y_result = xp.empty((2, n))
+
+        xp.add(x, offset_x, out=x_result[0])
+        xp.add(y, offset_y, out=y_result[0])
+        x_result[1] = x
+        y_result[1] = y
 
-        # Combine shadow + original
-        x_result = np.concatenate([x_shadow, x])
-        y_result = np.concatenate([y_shadow, y])
+        if stacked:
+            return x_result, y_result
 
-        return x_result, y_result
+        return x_result.ravel(), y_result.ravel()
 
     @staticmethod
     def spiral_effect(x: np.ndarray, y: np.ndarray,
@@ -243,14 +370,22 @@ class TextEffects:
         Returns:
             Tuple of (spiraled_x, spiraled_y)
         """
-        # Calculate distance from origin
-        r = np.sqrt(x**2 + y**2)
+        # Distance from origin in one pass (no x**2/y**2 temporaries,
+        # overflow-safe)
+        xp = TextEffects.xp
+        r = xp.hypot(x, y)
 
         # Apply rotation based on distance
-        theta = np.arctan2(y, x) + intensity * r
-
-        x_spiral = r * np.cos(theta)
-        y_spiral = r * np.sin(theta)
+        theta = xp.arctan2(y, x)
+        theta += intensity * r
+
+        # Write cos/sin directly into the output buffers, then scale
+        x_spiral = xp.empty_like(r)
+        y_spiral = xp.empty_like(r)
+        xp.cos(theta, out=x_spiral)
+        xp.sin(theta, out=y_spiral)
+        x_spiral *= r
+        y_spiral *= r
 
         return x_spiral, y_spiral
 
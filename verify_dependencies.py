@@ -4,6 +4,71 @@ Lissajous Text Generation System - Dependency Verification
 Run after installation to verify all components work correctly
 """
 
+import functools
+import importlib.metadata
+import importlib.util
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Module names whose installed distribution is named differently
+_DIST_NAMES = {'freetype': 'freetype-py'}
+
+
+@functools.lru_cache(maxsize=None)
+def probe_package(module):
+    """
+    Check whether a module is importable and report its version
+
+    Presence is decided with importlib.util.find_spec, which only walks
+    the import path - a missing package is answered without raising and
+    unwinding an ImportError, and nothing is executed just to be told
+    it is absent. Memoized: the installed set cannot change within one
+    process, so repeated verification runs (GUI startup plus wizard,
+    tests) pay the lookup once per package.
+
+    Args:
+        module: Importable module name, e.g. 'numpy'
+
+    Returns:
+        Version string if installed, None if missing
+    """
+    try:
+        if importlib.util.find_spec(module) is None:
+            return None
+    except (ImportError, ValueError):
+        return None
+
+    # Special handling for tkinter: stdlib, so no distribution metadata
+    if module == 'tkinter':
+        mod = __import__(module)
+        return f"{mod.TkVersion}"
+
+    # Read the version from distribution metadata - no module execution
+    try:
+        return importlib.metadata.version(_DIST_NAMES.get(module, module))
+    except importlib.metadata.PackageNotFoundError:
+        pass
+
+    # Installed but without matching metadata (editable/odd packaging):
+    # import it and ask the module itself
+    mod = __import__(module)
+    return getattr(mod, '__version__', 'unknown')
+
+
+@functools.lru_cache(maxsize=1)
+def _query_audio_devices():
+    """
+    Enumerate PortAudio devices once per process
+
+    sd.query_devices walks every ALSA/PulseAudio device and can take
+    hundreds of milliseconds; installer scripts that call
+    verify_dependencies repeatedly get the cached list after the
+    first scan.
+    """
+    import sounddevice as sd
+    return sd.query_devices()
+
+
 def verify_dependencies():
     print("=" * 70)
     print("LISSAJOUS TEXT GENERATION SYSTEM - DEPENDENCY CHECK")
@@ -36,24 +101,25 @@ def verify_dependencies():
         details = []
 
         for module, name in packages:
-            try:
-                mod = __import__(module)
-                ver = getattr(mod, '__version__', 'unknown')
-
-                # Special handling for tkinter
-                if module == 'tkinter':
-                    ver = f"{mod.TkVersion}"
-
+            ver = probe_package(module)
+            if ver is not None:
                 print(f"  ✓ {name:20} v{ver}")
                 status['installed'] += 1
                 details.append((name, ver, True))
-            except ImportError:
+            else:
                 print(f"  ✗ {name:20} MISSING")
                 status['missing'] += 1
                 details.append((name, None, False))
 
         return status, details
 
+    # Warm the probe cache in parallel before printing: imports spend
+    # much of their time in disk I/O, which threads overlap nicely.
+    # The check_packages calls below then report from cache, in order.
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        pool.map(probe_package,
+                 [m for m, _ in critical + recommended + optional])
+
     print("\n" + "=" * 70)
     crit_status, crit_details = check_packages(critical, "CRITICAL Dependencies")
 
@@ -105,7 +171,7 @@ def verify_dependencies():
         # Test SoundDevice
         try:
             import sounddevice as sd
-            devices = sd.query_devices()
+            devices = _query_audio_devices()
             print(f"\n  Audio Devices: {len(devices)} found")
             default_out = sd.default.device[1]
             if default_out is not None:
@@ -119,12 +185,26 @@ def verify_dependencies():
         try:
             import pyvisa
             rm = pyvisa.ResourceManager('@py')
-            resources = rm.list_resources()
-            print(f"\n  VISA Resources: {len(resources)} found")
-            if resources:
+            # list_resources probes every bus with default timeouts and
+            # can hang ~10s per absent GPIB board; run it in a daemon
+            # thread and give up after a bounded wait instead (a daemon
+            # thread won't hold the process open if the probe is stuck)
+            found = []
+            scan = threading.Thread(
+                target=lambda: found.append(rm.list_resources()),
+                daemon=True)
+            scan.start()
+            scan.join(timeout=5.0)
+            resources = found[0] if found else None
+            if resources is None:
+                print("\n  VISA Resources: scan timed out after 5s")
+                print("    (Slow bus probe - check connections, or rerun)")
+            elif resources:
+                print(f"\n  VISA Resources: {len(resources)} found")
                 for res in resources:
                     print(f"    - {res}")
             else:
+                print("\n  VISA Resources: 0 found")
                 print("    (No instruments detected - this is normal if not connected)")
         except Exception as e:
             print(f"\n  ✗ PyVISA check failed: {e}")
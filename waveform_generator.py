@@ -23,6 +23,32 @@ class WaveformType(Enum):
     ARBITRARY = "ARB"
 
 
+# Rendered sine tones keyed by (frequency, sample_rate, num_samples);
+# repeated playback of the standard test tones reuses the cached array
+# instead of re-running np.sin
+_TONE_CACHE = {}
+
+# Standard DTMF keypad: digit -> (low row freq, high column freq) in Hz
+DTMF_FREQUENCIES = {
+    '1': (697, 1209), '2': (697, 1336), '3': (697, 1477), 'A': (697, 1633),
+    '4': (770, 1209), '5': (770, 1336), '6': (770, 1477), 'B': (770, 1633),
+    '7': (852, 1209), '8': (852, 1336), '9': (852, 1477), 'C': (852, 1633),
+    '*': (941, 1209), '0': (941, 1336), '#': (941, 1477), 'D': (941, 1633),
+}
+
+
+def _tone_samples(frequency, sample_rate, num_samples):
+    """Cached unit-amplitude sine tone (read-only array)"""
+    key = (frequency, sample_rate, num_samples)
+    tone = _TONE_CACHE.get(key)
+    if tone is None:
+        t = np.arange(num_samples) / sample_rate
+        tone = np.sin(2 * np.pi * frequency * t)
+        tone.setflags(write=False)
+        _TONE_CACHE[key] = tone
+    return tone
+
+
 class WaveformGenerator:
     """Control the built-in waveform generator"""
     
@@ -35,14 +61,46 @@ class WaveformGenerator:
         """
         self.scope = scope
         self.channel = 1  # SOURCE1
-        
-    def is_available(self):
-        """Check if generator is available"""
+        # Generator presence cannot change while connected, so the
+        # probe result is cached after the first query
+        self._available = None
+        # Terminator and chunk tuning, best-effort: callers may hand
+        # in an already-configured (or simulated) resource
         try:
-            response = self.scope.query(':SOURCE1:OUTPUT?').strip()
-            return response in ['ON', 'OFF', '1', '0']
-        except:
-            return False
+            if getattr(scope, 'read_termination', None) is None:
+                scope.read_termination = '\n'
+            if getattr(scope, 'write_termination', None) is None:
+                scope.write_termination = '\n'
+            if getattr(scope, 'chunk_size', 0) < 102400:
+                scope.chunk_size = 102400
+        except (AttributeError, pyvisa.VisaIOError):
+            pass
+
+    def invalidate_cache(self):
+        """Forget the cached availability probe (e.g. on reconnect)"""
+        self._available = None
+
+    def _write_batch(self, commands):
+        """
+        Send several SCPI commands as one semicolon-joined message
+
+        Over TCPIP each write() is a full network round trip; joining
+        the fragments collapses a 4-5 command setter into one.
+
+        Args:
+            commands: Iterable of SCPI command strings
+        """
+        self.scope.write(';'.join(commands))
+
+    def is_available(self):
+        """Check if generator is available (cached after first probe)"""
+        if self._available is None:
+            try:
+                response = self.scope.query(':SOURCE1:OUTPUT?').strip()
+                self._available = response in ['ON', 'OFF', '1', '0']
+            except pyvisa.VisaIOError:
+                self._available = False
+        return self._available
     
     def enable(self):
         """Turn on the generator output"""
@@ -50,7 +108,7 @@ class WaveformGenerator:
             self.scope.write(':SOURCE1:OUTPUT ON')
             print("✅ Generator output enabled")
             return True
-        except Exception as e:
+        except pyvisa.VisaIOError as e:
             print(f"❌ Failed to enable generator: {e}")
             return False
     
@@ -60,7 +118,7 @@ class WaveformGenerator:
             self.scope.write(':SOURCE1:OUTPUT OFF')
             print("✅ Generator output disabled")
             return True
-        except Exception as e:
+        except pyvisa.VisaIOError as e:
             print(f"❌ Failed to disable generator: {e}")
             return False
     
@@ -74,18 +132,18 @@ class WaveformGenerator:
             offset: DC offset voltage (-5V to +5V)
         """
         try:
-            # Set function type
-            self.scope.write(':SOURCE1:FUNCTION SIN')
-            
-            # Set parameters
-            self.scope.write(f':SOURCE1:FREQUENCY {frequency}')
-            self.scope.write(f':SOURCE1:VOLTAGE {amplitude}')
-            self.scope.write(f':SOURCE1:VOLTAGE:OFFSET {offset}')
+            # Function and all parameters in one round trip
+            self._write_batch([
+                ':SOURCE1:FUNCTION SIN',
+                f':SOURCE1:FREQUENCY {frequency}',
+                f':SOURCE1:VOLTAGE {amplitude}',
+                f':SOURCE1:VOLTAGE:OFFSET {offset}',
+            ])
             
             print(f"✅ Sine wave: {frequency} Hz, {amplitude} Vpp, {offset}V offset")
             return True
             
-        except Exception as e:
+        except pyvisa.VisaIOError as e:
             print(f"❌ Failed to set sine wave: {e}")
             return False
     
@@ -100,16 +158,18 @@ class WaveformGenerator:
             duty_cycle: Duty cycle percentage (10-90)
         """
         try:
-            self.scope.write(':SOURCE1:FUNCTION SQU')
-            self.scope.write(f':SOURCE1:FREQUENCY {frequency}')
-            self.scope.write(f':SOURCE1:VOLTAGE {amplitude}')
-            self.scope.write(f':SOURCE1:VOLTAGE:OFFSET {offset}')
-            self.scope.write(f':SOURCE1:SQUARE:DUTY {duty_cycle}')
+            self._write_batch([
+                ':SOURCE1:FUNCTION SQU',
+                f':SOURCE1:FREQUENCY {frequency}',
+                f':SOURCE1:VOLTAGE {amplitude}',
+                f':SOURCE1:VOLTAGE:OFFSET {offset}',
+                f':SOURCE1:SQUARE:DUTY {duty_cycle}',
+            ])
             
             print(f"✅ Square wave: {frequency} Hz, {amplitude} Vpp, {duty_cycle}% duty")
             return True
             
-        except Exception as e:
+        except pyvisa.VisaIOError as e:
             print(f"❌ Failed to set square wave: {e}")
             return False
     
@@ -124,16 +184,18 @@ class WaveformGenerator:
             symmetry: Ramp symmetry percentage (0-100)
         """
         try:
-            self.scope.write(':SOURCE1:FUNCTION RAMP')
-            self.scope.write(f':SOURCE1:FREQUENCY {frequency}')
-            self.scope.write(f':SOURCE1:VOLTAGE {amplitude}')
-            self.scope.write(f':SOURCE1:VOLTAGE:OFFSET {offset}')
-            self.scope.write(f':SOURCE1:RAMP:SYMMETRY {symmetry}')
+            self._write_batch([
+                ':SOURCE1:FUNCTION RAMP',
+                f':SOURCE1:FREQUENCY {frequency}',
+                f':SOURCE1:VOLTAGE {amplitude}',
+                f':SOURCE1:VOLTAGE:OFFSET {offset}',
+                f':SOURCE1:RAMP:SYMMETRY {symmetry}',
+            ])
             
             print(f"✅ Ramp wave: {frequency} Hz, {amplitude} Vpp, {symmetry}% symmetry")
             return True
             
-        except Exception as e:
+        except pyvisa.VisaIOError as e:
             print(f"❌ Failed to set ramp wave: {e}")
             return False
     
@@ -148,16 +210,18 @@ class WaveformGenerator:
             width: Pulse width in seconds
         """
         try:
-            self.scope.write(':SOURCE1:FUNCTION PULS')
-            self.scope.write(f':SOURCE1:FREQUENCY {frequency}')
-            self.scope.write(f':SOURCE1:VOLTAGE {amplitude}')
-            self.scope.write(f':SOURCE1:VOLTAGE:OFFSET {offset}')
-            self.scope.write(f':SOURCE1:PULSE:WIDTH {width}')
+            self._write_batch([
+                ':SOURCE1:FUNCTION PULS',
+                f':SOURCE1:FREQUENCY {frequency}',
+                f':SOURCE1:VOLTAGE {amplitude}',
+                f':SOURCE1:VOLTAGE:OFFSET {offset}',
+                f':SOURCE1:PULSE:WIDTH {width}',
+            ])
             
             print(f"✅ Pulse wave: {frequency} Hz, {amplitude} Vpp, {width*1e6:.1f}µs width")
             return True
             
-        except Exception as e:
+        except pyvisa.VisaIOError as e:
             print(f"❌ Failed to set pulse wave: {e}")
             return False
     
@@ -170,14 +234,16 @@ class WaveformGenerator:
             offset: DC offset voltage
         """
         try:
-            self.scope.write(':SOURCE1:FUNCTION NOIS')
-            self.scope.write(f':SOURCE1:VOLTAGE {amplitude}')
-            self.scope.write(f':SOURCE1:VOLTAGE:OFFSET {offset}')
+            self._write_batch([
+                ':SOURCE1:FUNCTION NOIS',
+                f':SOURCE1:VOLTAGE {amplitude}',
+                f':SOURCE1:VOLTAGE:OFFSET {offset}',
+            ])
             
             print(f"✅ Noise: {amplitude} Vpp, {offset}V offset")
             return True
             
-        except Exception as e:
+        except pyvisa.VisaIOError as e:
             print(f"❌ Failed to set noise: {e}")
             return False
     
@@ -189,13 +255,15 @@ class WaveformGenerator:
             voltage: DC voltage level (-5V to +5V)
         """
         try:
-            self.scope.write(':SOURCE1:FUNCTION DC')
-            self.scope.write(f':SOURCE1:VOLTAGE:OFFSET {voltage}')
+            self._write_batch([
+                ':SOURCE1:FUNCTION DC',
+                f':SOURCE1:VOLTAGE:OFFSET {voltage}',
+            ])
             
             print(f"✅ DC output: {voltage}V")
             return True
             
-        except Exception as e:
+        except pyvisa.VisaIOError as e:
             print(f"❌ Failed to set DC: {e}")
             return False
     
@@ -209,16 +277,18 @@ class WaveformGenerator:
             sweep_time: Sweep duration in seconds
         """
         try:
-            # Enable sweep mode
-            self.scope.write(':SOURCE1:SWEEP:STATE ON')
-            self.scope.write(f':SOURCE1:FREQUENCY:START {start_freq}')
-            self.scope.write(f':SOURCE1:FREQUENCY:STOP {stop_freq}')
-            self.scope.write(f':SOURCE1:SWEEP:TIME {sweep_time}')
+            # Sweep parameters first, then enable, in one round trip
+            self._write_batch([
+                f':SOURCE1:FREQUENCY:START {start_freq}',
+                f':SOURCE1:FREQUENCY:STOP {stop_freq}',
+                f':SOURCE1:SWEEP:TIME {sweep_time}',
+                ':SOURCE1:SWEEP:STATE ON',
+            ])
             
             print(f"✅ Frequency sweep: {start_freq} Hz to {stop_freq} Hz in {sweep_time}s")
             return True
             
-        except Exception as e:
+        except pyvisa.VisaIOError as e:
             print(f"❌ Failed to set sweep: {e}")
             return False
     
@@ -232,16 +302,18 @@ class WaveformGenerator:
             mod_depth: Modulation depth percentage (0-100)
         """
         try:
-            self.scope.write(f':SOURCE1:FREQUENCY {carrier_freq}')
-            self.scope.write(':SOURCE1:MOD:TYPE AM')
-            self.scope.write(f':SOURCE1:MOD:AM:FREQUENCY {mod_freq}')
-            self.scope.write(f':SOURCE1:MOD:AM:DEPTH {mod_depth}')
-            self.scope.write(':SOURCE1:MOD:STATE ON')
+            self._write_batch([
+                f':SOURCE1:FREQUENCY {carrier_freq}',
+                ':SOURCE1:MOD:TYPE AM',
+                f':SOURCE1:MOD:AM:FREQUENCY {mod_freq}',
+                f':SOURCE1:MOD:AM:DEPTH {mod_depth}',
+                ':SOURCE1:MOD:STATE ON',
+            ])
             
             print(f"✅ AM modulation: {carrier_freq} Hz carrier, {mod_freq} Hz mod, {mod_depth}% depth")
             return True
             
-        except Exception as e:
+        except pyvisa.VisaIOError as e:
             print(f"❌ Failed to set AM modulation: {e}")
             return False
     
@@ -251,24 +323,79 @@ class WaveformGenerator:
             status = {}
             status['output'] = self.scope.query(':SOURCE1:OUTPUT?').strip()
             status['function'] = self.scope.query(':SOURCE1:FUNCTION?').strip()
-            status['frequency'] = float(self.scope.query(':SOURCE1:FREQUENCY?').strip())
-            status['amplitude'] = float(self.scope.query(':SOURCE1:VOLTAGE?').strip())
-            
+            # query_ascii_values parses the response buffer straight to
+            # float - no intermediate stripped-string objects per field
+            status['frequency'] = self.scope.query_ascii_values(
+                ':SOURCE1:FREQUENCY?')[0]
+            status['amplitude'] = self.scope.query_ascii_values(
+                ':SOURCE1:VOLTAGE?')[0]
+
             # Try to get offset
             try:
-                status['offset'] = float(self.scope.query(':SOURCE1:VOLTAGE:OFFSET?').strip())
-            except:
+                status['offset'] = self.scope.query_ascii_values(
+                    ':SOURCE1:VOLTAGE:OFFSET?')[0]
+            except (pyvisa.VisaIOError, ValueError):
                 status['offset'] = 0.0
-            
+
             # Get full apply string
             status['apply'] = self.scope.query(':SOURCE1:APPLY?').strip()
-            
+
             return status
-            
-        except Exception as e:
+
+        except pyvisa.VisaIOError as e:
             print(f"Error getting status: {e}")
             return None
     
+    def play_dtmf(self, digits, tone_duration=0.2, gap=0.05,
+                  sample_rate=44100, amplitude=0.4):
+        """
+        Play DTMF digits through the sound card
+
+        The scope's generator is single-tone, so dual-tone dialing
+        signals are synthesized here instead: each digit is the sum of
+        its cached row and column tones, assembled into one buffer and
+        streamed via sounddevice.
+
+        Args:
+            digits: String of keypad characters (0-9, A-D, *, #)
+            tone_duration: Seconds per digit
+            gap: Seconds of silence between digits
+            sample_rate: Playback sample rate in Hz
+            amplitude: Peak amplitude of the summed tones (0-1)
+
+        Returns:
+            True if the sequence played, False otherwise
+        """
+        try:
+            import sounddevice as sd
+        except ImportError:
+            print("❌ sounddevice not available - cannot play DTMF")
+            return False
+
+        tone_samples = int(tone_duration * sample_rate)
+        gap_samples = int(gap * sample_rate)
+        silence = np.zeros(gap_samples)
+
+        pieces = []
+        for digit in str(digits).upper():
+            freqs = DTMF_FREQUENCIES.get(digit)
+            if freqs is None:
+                continue
+            low = _tone_samples(freqs[0], sample_rate, tone_samples)
+            high = _tone_samples(freqs[1], sample_rate, tone_samples)
+            # Sum of the two cached tones, scaled to stay within ±1
+            pieces.append((low + high) * (amplitude / 2))
+            pieces.append(silence)
+
+        if not pieces:
+            print("❌ No valid DTMF digits in input")
+            return False
+
+        sd.play(np.concatenate(pieces), sample_rate)
+        sd.wait()
+        print(f"✅ Played DTMF: {digits}")
+        return True
+
     def audio_test_signals(self):
         """Generate common audio test signals"""
         print("\n🎵 AUDIO TEST SIGNAL MENU")
@@ -294,9 +421,12 @@ class WaveformGenerator:
         elif choice == '5':
             self.set_square(1000, 1.0)
         elif choice == '6':
-            # DTMF example (would need two-tone generation)
-            print("DTMF requires dual-tone - using 697Hz")
-            self.set_sine(697, 1.0)
+            # Dual-tone DTMF goes out through the sound card; the
+            # scope's generator can only produce one tone at a time
+            digits = input("Digits to dial [0-9 A-D * #]: ").strip()
+            if not self.play_dtmf(digits or '0'):
+                print("Falling back to single 697Hz tone on generator")
+                self.set_sine(697, 1.0)
         elif choice == '7':
             freq = float(input("Frequency (Hz): "))
             amp = float(input("Amplitude (Vpp) [1.0]: ") or "1.0")
@@ -368,8 +498,6 @@ def generator_wizard(scope):
 
 if __name__ == "__main__":
     # Test the generator
-    import pyvisa
-    
     rm = pyvisa.ResourceManager('@py')
     scope = rm.open_resource('TCPIP::192.168.68.72::INSTR')
     scope.timeout = 5000
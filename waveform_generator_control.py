@@ -7,18 +7,33 @@ Generate test signals through sound card while monitoring on oscilloscope
 import warnings
 warnings.filterwarnings('ignore', message='Unable to import Axes3D.*', category=UserWarning)
 
+import math
+
 import numpy as np
 import sounddevice as sd
 import matplotlib.pyplot as plt
 from matplotlib.widgets import Slider, Button, RadioButtons
+import queue
 import threading
 import time
 from rigol_oscilloscope_control import RigolDS1104Z
 import config
 
 class WaveformGeneratorControl:
-    def __init__(self):
+    def __init__(self, blocksize=1024, low_latency=False):
+        """
+        Args:
+            blocksize: Audio frames per callback. 1024 at 48 kHz means
+                       ~21 ms per block - fewer Python callbacks and
+                       less per-call overhead than small blocks, and
+                       for a steady Lissajous signal the added latency
+                       is irrelevant.
+            low_latency: Use a 256-frame block (~5 ms) instead, for
+                         setups where knob-to-output delay matters
+                         more than CPU headroom.
+        """
         self.sample_rate = 48000
+        self.blocksize = 256 if low_latency else blocksize
         self.is_playing = False
         self.stream = None
         
@@ -28,11 +43,89 @@ class WaveformGeneratorControl:
         self.phase = 0.0
         self.amplitude = 0.5
         self.waveform_type = 'sine'
+        # Redraw-coalescing flag; consumed by the GUI timer
+        self._dirty = False
         
         # Oscilloscope connection
         self.scope_ctrl = None
         self.scope = None
-        
+
+        # Persistent per-channel phase accumulators (radians, kept in
+        # [0, 2π)) and scratch buffers for the audio callback. The old
+        # callback restarted t at zero every block, which both clicked
+        # audibly at block boundaries and reallocated three arrays per
+        # 5 ms callback; carrying phase across blocks fixes the
+        # discontinuity and the scratch buffers kill the allocations.
+        self._phase_acc_l = 0.0
+        self._phase_acc_r = 0.0
+        self._ph_l = None
+        self._ph_r = None
+        self._ramp = None
+        # PCG64 generator for the noise waveform: faster per sample
+        # than the legacy global np.random and lock-free, and its
+        # out= form fills the existing scratch with no allocation
+        self._rng = np.random.default_rng()
+        # Size the scratch for the configured block up front so the
+        # first callback does not allocate either
+        self._ensure_scratch(self.blocksize)
+
+        # SCPI queries block on the instrument for 10-100 ms each, so
+        # they run on a dedicated worker thread fed by this queue -
+        # the matplotlib event thread (and, via the GIL, the audio
+        # callback) never waits on the scope
+        self._scope_q = queue.Queue()
+        self._scope_thread = threading.Thread(
+            target=self._scope_worker, daemon=True)
+        self._scope_thread.start()
+
+    def _scope_worker(self):
+        """Run queued scope jobs; exits with the process (daemon)"""
+        while True:
+            job = self._scope_q.get()
+            if job is None:
+                break
+            try:
+                job()
+            except Exception as e:
+                print(f"Scope worker error: {e}")
+
+    def _ensure_scratch(self, frames):
+        """Size the callback scratch buffers for the current block
+
+        float32 throughout: it is what the audio backend consumes,
+        halves memory traffic and doubles SIMD lanes, and within one
+        block phase never grows past a few hundred radians, well
+        inside float32 precision. The accumulators stay Python floats.
+        """
+        if self._ramp is None or len(self._ramp) < frames:
+            self._ramp = np.arange(frames, dtype=np.float32)
+            self._ph_l = np.empty(frames, dtype=np.float32)
+            self._ph_r = np.empty(frames, dtype=np.float32)
+
+    def _phase_block(self, frames):
+        """
+        Fill scratch buffers with per-sample phase for one block
+
+        Returns (left, right) phase arrays in radians; the right
+        channel includes the phase offset. Advances the accumulators
+        by one block, wrapped modulo 2π so precision never degrades
+        as the stream runs.
+        """
+        self._ensure_scratch(frames)
+        ramp = self._ramp[:frames]
+        two_pi = 2 * np.pi
+        dphi_l = two_pi * self.freq_left / self.sample_rate
+        dphi_r = two_pi * self.freq_right / self.sample_rate
+
+        ph_l = np.multiply(ramp, dphi_l, out=self._ph_l[:frames])
+        ph_l += self._phase_acc_l
+        ph_r = np.multiply(ramp, dphi_r, out=self._ph_r[:frames])
+        ph_r += self._phase_acc_r + self.phase
+
+        self._phase_acc_l = (self._phase_acc_l + dphi_l * frames) % two_pi
+        self._phase_acc_r = (self._phase_acc_r + dphi_r * frames) % two_pi
+        return ph_l, ph_r
+
     def connect_scope(self):
         """Connect to oscilloscope for monitoring"""
         try:
@@ -51,31 +144,61 @@ class WaveformGeneratorControl:
         if status:
             print(status)
         
-        t = np.arange(frames) / self.sample_rate
-        
-        # Generate waveforms based on type
+        if self.waveform_type == 'noise':
+            self._ensure_scratch(frames)
+            gain = self.amplitude * 0.3
+            self._rng.standard_normal(frames, dtype=np.float32,
+                                      out=self._ph_l[:frames])
+            np.multiply(self._ph_l[:frames], gain, out=outdata[:, 0])
+            self._rng.standard_normal(frames, dtype=np.float32,
+                                      out=self._ph_r[:frames])
+            np.multiply(self._ph_r[:frames], gain, out=outdata[:, 1])
+            return
+
+        # All periodic waveforms derive from the per-sample phase; the
+        # in-place ufuncs reuse the phase scratch so the callback does
+        # no heap allocation in steady state
+        ph_l, ph_r = self._phase_block(frames)
+        amp = self.amplitude
+
         if self.waveform_type == 'sine':
-            left = self.amplitude * np.sin(2 * np.pi * self.freq_left * t)
-            right = self.amplitude * np.sin(2 * np.pi * self.freq_right * t + self.phase)
-        
+            np.sin(ph_l, out=ph_l)
+            np.sin(ph_r, out=ph_r)
+
         elif self.waveform_type == 'square':
-            left = self.amplitude * np.sign(np.sin(2 * np.pi * self.freq_left * t))
-            right = self.amplitude * np.sign(np.sin(2 * np.pi * self.freq_right * t + self.phase))
-        
+            # sign(π - phase mod 2π) is +1 for the first half-cycle
+            # and -1 for the second: same square as sign(sin(phase))
+            # without the transcendental
+            for ph in (ph_l, ph_r):
+                np.mod(ph, 2 * np.pi, out=ph)
+                np.subtract(np.pi, ph, out=ph)
+                np.sign(ph, out=ph)
+
         elif self.waveform_type == 'triangle':
-            left = self.amplitude * 2 * np.arcsin(np.sin(2 * np.pi * self.freq_left * t)) / np.pi
-            right = self.amplitude * 2 * np.arcsin(np.sin(2 * np.pi * self.freq_right * t + self.phase)) / np.pi
-        
-        elif self.waveform_type == 'sawtooth':
-            left = self.amplitude * 2 * ((self.freq_left * t) % 1 - 0.5)
-            right = self.amplitude * 2 * ((self.freq_right * t + self.phase/(2*np.pi)) % 1 - 0.5)
-        
-        else:  # noise
-            left = self.amplitude * np.random.randn(frames) * 0.3
-            right = self.amplitude * np.random.randn(frames) * 0.3
-        
-        outdata[:, 0] = left
-        outdata[:, 1] = right
+            # Direct piecewise-linear triangle - identical to
+            # 2/π·arcsin(sin(phase)) but with no trig at all:
+            # fold the cycle fraction around its midpoint
+            for ph in (ph_l, ph_r):
+                ph *= 1 / (2 * np.pi)
+                ph += 0.75
+                np.mod(ph, 1, out=ph)
+                ph -= 0.5
+                np.abs(ph, out=ph)
+                ph *= 4
+                ph -= 1
+
+        else:  # sawtooth
+            ph_l *= 1 / (2 * np.pi)
+            np.mod(ph_l, 1, out=ph_l)
+            ph_l -= 0.5
+            ph_l *= 2
+            ph_r *= 1 / (2 * np.pi)
+            np.mod(ph_r, 1, out=ph_r)
+            ph_r -= 0.5
+            ph_r *= 2
+
+        np.multiply(ph_l, amp, out=outdata[:, 0])
+        np.multiply(ph_r, amp, out=outdata[:, 1])
     
     def start_generator(self):
         """Start waveform generation"""
@@ -84,7 +207,8 @@ class WaveformGeneratorControl:
                 samplerate=self.sample_rate,
                 channels=2,
                 callback=self.audio_callback,
-                blocksize=256
+                blocksize=self.blocksize,
+                dtype='float32'
             )
             self.stream.start()
             self.is_playing = True
@@ -134,8 +258,20 @@ class WaveformGeneratorControl:
         self.ax_display.set_ylabel('Right Channel', color='cyan')
         self.ax_display.set_title('XY Preview (Lissajous)', color='white')
         
-        # Waveform preview
-        self.line_preview, = self.ax_display.plot([], [], 'lime', linewidth=2)
+        # Waveform preview. The line is animated (excluded from full
+        # redraws) so slider updates can blit just this artist over a
+        # cached background instead of rerendering the whole figure
+        self.line_preview, = self.ax_display.plot([], [], 'lime', linewidth=2,
+                                                  animated=True)
+        self._preview_bg = None
+
+        # Fixed angular basis and output buffers for the preview:
+        # slider drags fire update_preview at display rates, so the
+        # 1000-point linspace and the two result arrays are allocated
+        # once here and refilled in place on every update
+        self._t_preview = np.linspace(0, 2*np.pi, 1000)
+        self._x_preview = np.empty(1000)
+        self._y_preview = np.empty(1000)
         
         # Control sliders
         slider_color = '#444444'
@@ -184,9 +320,12 @@ class WaveformGeneratorControl:
         # Info display
         self.ax_info = plt.subplot2grid((5, 3), (0, 2), colspan=1, rowspan=2)
         self.ax_info.axis('off')
+        # Animated for the same blitting scheme as the preview line:
+        # updates redraw only this artist over a cached background
         self.info_text = self.ax_info.text(0.05, 0.95, '', transform=self.ax_info.transAxes,
                                            color='white', fontsize=9, fontfamily='monospace',
-                                           verticalalignment='top')
+                                           verticalalignment='top', animated=True)
+        self._info_bg = None
         
         # Connect callbacks
         self.slider_freq_l.on_changed(self.update_params)
@@ -199,18 +338,39 @@ class WaveformGeneratorControl:
         self.btn_stop.on_clicked(self.on_stop)
         self.btn_measure.on_clicked(self.on_measure)
         
+        # Capture blit backgrounds once every artist exists; widget
+        # construction above can trigger intermediate draws
+        self.fig.canvas.mpl_connect('draw_event', self._on_draw)
+
+        # Slider.on_changed fires for every pixel of a drag; instead
+        # of redrawing per event, parameter changes set a dirty flag
+        # and this ~30 Hz timer coalesces them into at most one
+        # preview+info refresh per frame
+        self._redraw_timer = self.fig.canvas.new_timer(interval=33)
+        self._redraw_timer.add_callback(self._maybe_redraw)
+        self._redraw_timer.start()
+
         # Initial update
         self.update_preview()
         self.update_info()
+
+    def _maybe_redraw(self):
+        """Timer callback: redraw once if any parameter changed"""
+        if self._dirty:
+            self._dirty = False
+            self.update_preview()
+            self.update_info()
     
     def update_params(self, val):
         """Update parameters from sliders"""
         self.freq_left = self.slider_freq_l.val
         self.freq_right = self.slider_freq_r.val
-        self.phase = np.radians(self.slider_phase.val)
+        # math.radians on a plain float skips numpy's scalar ufunc
+        # dispatch; this runs on every slider tick
+        self.phase = math.radians(self.slider_phase.val)
         self.amplitude = self.slider_amp.val
-        self.update_preview()
-        self.update_info()
+        # Coalesced by the redraw timer rather than drawn per event
+        self._dirty = True
     
     def set_preset(self, label):
         """Set preset frequency ratio"""
@@ -231,22 +391,41 @@ class WaveformGeneratorControl:
     def set_waveform(self, label):
         """Set waveform type"""
         self.waveform_type = label.lower()
-        self.update_preview()
+        self._dirty = True
     
+    def _on_draw(self, event):
+        """Recapture the blit backgrounds after any full redraw"""
+        self._preview_bg = self.fig.canvas.copy_from_bbox(
+            self.ax_display.bbox)
+        self.ax_display.draw_artist(self.line_preview)
+        self._info_bg = self.fig.canvas.copy_from_bbox(
+            self.ax_info.bbox)
+        self.ax_info.draw_artist(self.info_text)
+
     def update_preview(self):
         """Update Lissajous preview"""
-        t = np.linspace(0, 2*np.pi, 1000)
-        
-        if self.waveform_type == 'sine':
-            x = np.sin(self.freq_left/440 * t)
-            y = np.sin(self.freq_right/440 * t + self.phase)
-        else:
-            # Simplified preview for other waveforms
-            x = np.sin(self.freq_left/440 * t)
-            y = np.sin(self.freq_right/440 * t + self.phase)
-        
+        # Simplified sine preview for all waveform types; scale the
+        # precomputed basis and take sin in place - no allocation
+        x = self._x_preview
+        y = self._y_preview
+        np.multiply(self._t_preview, self.freq_left/440, out=x)
+        np.sin(x, out=x)
+        np.multiply(self._t_preview, self.freq_right/440, out=y)
+        y += self.phase
+        np.sin(y, out=y)
+
         self.line_preview.set_data(x, y)
-        self.fig.canvas.draw_idle()
+        if self._preview_bg is not None:
+            # Blit path: restore the cached axes background and
+            # rerasterize only the preview line - the rest of the
+            # figure (labels, grid, widgets) is untouched
+            canvas = self.fig.canvas
+            canvas.restore_region(self._preview_bg)
+            self.ax_display.draw_artist(self.line_preview)
+            canvas.blit(self.ax_display.bbox)
+        else:
+            # No background yet (first draw still pending)
+            self.fig.canvas.draw_idle()
     
     def update_info(self):
         """Update info display"""
@@ -263,7 +442,7 @@ class WaveformGeneratorControl:
         info += f"  Amplitude: {self.amplitude*100:.0f}%\n\n"
         info += f"PATTERN:\n"
         info += f"  Ratio: {ratio:.3f}\n"
-        info += f"  Phase: {np.degrees(self.phase):.0f}°\n"
+        info += f"  Phase: {math.degrees(self.phase):.0f}°\n"
         info += f"  Type: {self.waveform_type}\n\n"
         
         if self.scope:
@@ -272,7 +451,15 @@ class WaveformGeneratorControl:
             info += f"SCOPE: Not connected\n"
         
         self.info_text.set_text(info)
-        self.fig.canvas.draw_idle()
+        if self._info_bg is not None:
+            # Rerender only the text artist over the cached panel
+            # background; no full-figure redraw per slider tick
+            canvas = self.fig.canvas
+            canvas.restore_region(self._info_bg)
+            self.ax_info.draw_artist(self.info_text)
+            canvas.blit(self.ax_info.bbox)
+        else:
+            self.fig.canvas.draw_idle()
     
     def on_start(self, event):
         """Start button callback"""
@@ -286,14 +473,20 @@ class WaveformGeneratorControl:
             print("⏹️  Generator stopped")
         self.update_info()
     
+    def _measure_job(self):
+        """Worker-thread body for the Measure button"""
+        measurements = self.measure_output()
+        if measurements:
+            print("\n📏 MEASUREMENTS:")
+            print(f"  CH1: {measurements['ch1']['vpp']:.3f} Vpp @ {measurements['ch1']['freq']:.1f} Hz")
+            print(f"  CH2: {measurements['ch2']['vpp']:.3f} Vpp @ {measurements['ch2']['freq']:.1f} Hz")
+
     def on_measure(self, event):
         """Measure button callback"""
         if self.scope:
-            measurements = self.measure_output()
-            if measurements:
-                print("\n📏 MEASUREMENTS:")
-                print(f"  CH1: {measurements['ch1']['vpp']:.3f} Vpp @ {measurements['ch1']['freq']:.1f} Hz")
-                print(f"  CH2: {measurements['ch2']['vpp']:.3f} Vpp @ {measurements['ch2']['freq']:.1f} Hz")
+            # Hand the blocking SCPI round trips to the worker; the
+            # button callback returns immediately
+            self._scope_q.put(self._measure_job)
         else:
             print("No oscilloscope connected")
     
@@ -4,50 +4,124 @@ Quick zoom control for XY display
 Usage: python3 zoom.py [in|out|fit|1|2|5]
 """
 
-import warnings
-warnings.filterwarnings('ignore', message='Unable to import Axes3D.*', category=UserWarning)
-
-from rigol_oscilloscope_control import RigolDS1104Z
-import config
+# Only stdlib imports at module scope: zoom is a CLI tool users run
+# repeatedly, and pulling in rigol_oscilloscope_control (and with it
+# numpy, matplotlib and pyvisa) costs hundreds of milliseconds of
+# startup. The heavy stack is imported lazily, and only on the
+# direct-connect fallback path - the daemon path never needs it.
+import bisect
+import json
+import socket
 import sys
 
+# Standard V/div steps, ordered; shared by every zoom branch
+SCALES = (0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1, 2, 5)
+
+# Unix socket of scope_daemon.py; when the daemon is running the
+# TCP connect + *IDN? handshake is skipped entirely
+DAEMON_SOCKET = '/tmp/anthroscope.sock'
+
+
+class _DaemonScope:
+    """
+    Client for the scope_daemon Unix socket
+
+    Mirrors the subset of the RigolDS1104Z/PyVISA surface set_zoom
+    uses (scope.query/write/close and get_measurement), so the zoom
+    logic runs unchanged over either transport.
+    """
+
+    def __init__(self, sock):
+        self._stream = sock.makefile('rwb')
+        self.scope = self
+
+    def _request(self, **request):
+        self._stream.write(json.dumps(request).encode() + b'\n')
+        self._stream.flush()
+        reply = json.loads(self._stream.readline())
+        if not reply.get('ok'):
+            raise RuntimeError(reply.get('error', 'daemon error'))
+        return reply.get('result')
+
+    def query(self, command):
+        return self._request(cmd='query', arg=command)
+
+    def write(self, command):
+        self._request(cmd='write', arg=command)
+
+    def get_measurement(self, channel, measurement_type):
+        try:
+            return float(self._request(
+                cmd='query',
+                arg=f':MEASure:ITEM? {measurement_type},CHANnel{channel}'))
+        except (RuntimeError, ValueError):
+            return None
+
+    def close(self):
+        self._stream.close()
+
+
+def _connect_daemon():
+    """Return a _DaemonScope if the daemon is up, else None"""
+    try:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(2.0)
+        sock.connect(DAEMON_SOCKET)
+        return _DaemonScope(sock)
+    except OSError:
+        return None
+
+
+def _nearest_scale_index(value):
+    """Index of the SCALES entry closest to value (binary search)"""
+    i = bisect.bisect_left(SCALES, value)
+    if i == 0:
+        return 0
+    if i == len(SCALES):
+        return len(SCALES) - 1
+    return i if SCALES[i] - value < value - SCALES[i - 1] else i - 1
+
 def set_zoom(command='fit'):
-    scope_ctrl = RigolDS1104Z(config.RIGOL_IP)
-    if not scope_ctrl.connect():
-        return
-    
+    # Prefer the persistent daemon connection; fall back to opening
+    # the scope directly when no daemon is running
+    scope_ctrl = _connect_daemon()
+    if scope_ctrl is None:
+        import warnings
+        warnings.filterwarnings('ignore',
+                                message='Unable to import Axes3D.*',
+                                category=UserWarning)
+        from rigol_oscilloscope_control import RigolDS1104Z
+        import config
+        scope_ctrl = RigolDS1104Z(config.RIGOL_IP)
+        if not scope_ctrl.connect():
+            return
+
     scope = scope_ctrl.scope
     
     # Get current scale
     current = float(scope.query(':CHANnel1:SCALe?'))
+    vpp1 = None
     
     if command == 'in':
         # Zoom in (smaller scale)
-        scales = [0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1, 2, 5]
-        idx = min(range(len(scales)), key=lambda i: abs(scales[i] - current))
-        if idx > 0:
-            new_scale = scales[idx - 1]
-        else:
-            new_scale = current
-            
+        idx = _nearest_scale_index(current)
+        new_scale = SCALES[idx - 1] if idx > 0 else current
+
     elif command == 'out':
         # Zoom out (larger scale)
-        scales = [0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1, 2, 5]
-        idx = min(range(len(scales)), key=lambda i: abs(scales[i] - current))
-        if idx < len(scales) - 1:
-            new_scale = scales[idx + 1]
-        else:
-            new_scale = current
+        idx = _nearest_scale_index(current)
+        new_scale = SCALES[idx + 1] if idx < len(SCALES) - 1 else current
             
     elif command.replace('.', '').isdigit():
         # Direct scale value
         new_scale = float(command)
         
     else:  # fit
-        # Auto-fit based on measurements
+        # Auto-fit based on measurements; measured once here and
+        # reused for the screen-usage report below
         vpp1 = scope_ctrl.get_measurement(1, 'VPP')
         vpp2 = scope_ctrl.get_measurement(2, 'VPP')
-        
+
         if vpp1 and vpp1 < 9e37:
             scale1 = vpp1 / 6.4
         else:
@@ -61,19 +135,19 @@ def set_zoom(command='fit'):
         new_scale = max(scale1, scale2)
         
         # Round to standard value
-        scales = [0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1, 2, 5]
-        new_scale = min(scales, key=lambda x: abs(x - new_scale))
+        new_scale = SCALES[_nearest_scale_index(new_scale)]
     
     # Apply new scale to both channels
     scope.write(f':CHANnel1:SCALe {new_scale}')
     scope.write(f':CHANnel2:SCALe {new_scale}')
     
     print(f"Scale: {current} → {new_scale} V/div")
-    
-    # Calculate screen usage
-    vpp1 = scope_ctrl.get_measurement(1, 'VPP')
-    vpp2 = scope_ctrl.get_measurement(2, 'VPP')
-    
+
+    # Calculate screen usage from the fit branch's measurement when
+    # available; only the other branches pay a fresh VPP query here
+    if vpp1 is None:
+        vpp1 = scope_ctrl.get_measurement(1, 'VPP')
+
     if vpp1 and vpp1 < 9e37:
         usage = (vpp1 / (new_scale * 8)) * 100
         print(f"Pattern uses ~{usage:.0f}% of screen")